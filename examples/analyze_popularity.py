@@ -78,7 +78,7 @@ def main():
     multimedia_counts = []
     
     print("Collecting metrics...")
-    for metrics in index._by_id.values():
+    for metrics in index.iter_metrics():
         scores.append(metrics.popularity_score)
         desc_lengths.append(metrics.description_length)
         section_counts.append(metrics.section_count)
@@ -41,7 +41,7 @@ def main():
     multimedia_counts = []
     
     print("Collecting metrics...")
-    for metrics in index._by_id.values():
+    for metrics in index.iter_metrics():
         scores.append(metrics.popularity_score)
         desc_lengths.append(metrics.description_length)
         section_counts.append(metrics.section_count)
@@ -146,7 +146,7 @@ def main():
     sample_vn_scores = []
     sample_mm_scores = []
     
-    all_metrics = list(index._by_id.values())
+    all_metrics = list(index.iter_metrics())
     for idx in sample_indices:
         m = all_metrics[idx]
         # Description component (0-20) - reduced from 40
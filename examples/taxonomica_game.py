@@ -26,13 +26,13 @@ from taxonomica.gbif_backbone import GBIFBackbone
 from taxonomica.gbif_tree import GBIFTaxonomyTree, TaxonomyNode
 from taxonomica.wikipedia import WikipediaData
 from taxonomica.redaction import Redactor, build_redaction_terms_from_node
-from taxonomica.popularity import PopularityIndex
+from taxonomica.popularity import DIFFICULTY_THRESHOLDS, PopularityIndex
 from taxonomica.ui import (
     clear_screen,
     wrap_text,
     format_rank,
     get_sorted_children,
-    display_node_list,
+    format_node_list,
     get_user_choice,
     NodeListDisplay,
     SortMode,
@@ -40,6 +40,36 @@ from taxonomica.ui import (
 )
 
 
+def _fast_sentence_split(text: str) -> list[str]:
+    """Split text at sentence boundaries without a regex.
+    
+    A boundary is '.', '!' or '?' followed by whitespace and an uppercase
+    ASCII letter. Terminators are located with str.find, so Python only
+    inspects the few characters that follow each one.
+    """
+    n = len(text)
+    positions = []
+    for ch in ".!?":
+        i = text.find(ch)
+        while i != -1:
+            positions.append(i)
+            i = text.find(ch, i + 1)
+    positions.sort()
+    
+    pieces = []
+    start = 0
+    for i in positions:
+        j = i + 1
+        while j < n and text[j].isspace():
+            j += 1
+        if j > i + 1 and j < n and "A" <= text[j] <= "Z":
+            pieces.append(text[start:i + 1])
+            start = j
+    pieces.append(text[start:])
+    
+    return pieces
+
+
 def split_into_sentences(text: str) -> list[str]:
     """Split text into sentences for progressive reveal.
     
@@ -49,15 +79,10 @@ def split_into_sentences(text: str) -> list[str]:
     Note: This has issues with name abbreviations (e.g., "Andrew S. Urquhart").
     Consider using split_into_lines() for more consistent chunk sizes.
     """
-    import re
-    
-    # Split on sentence-ending punctuation followed by space and capital letter
-    # or end of string
-    pattern = r'(?<=[.!?])\s+(?=[A-Z])'
-    sentences = re.split(pattern, text)
+    sentences = _fast_sentence_split(text)
     
     # Filter out very short "sentences" (likely fragments)
-    result = [s.strip() for s in sentences if s.strip()]
+    result = [s for s in map(str.strip, sentences) if s]
     
     # Ensure we have at least one sentence
     if not result and text.strip():
@@ -80,25 +105,26 @@ def split_into_lines(text: str, line_width: int = 90) -> list[str]:
         List of lines, each approximately line_width characters.
     """
     words = text.split()
-    lines = []
-    current_line = []
-    current_length = 0
-    
-    for word in words:
-        word_len = len(word)
-        # +1 for the space between words
-        if current_length + word_len + (1 if current_line else 0) > line_width:
-            if current_line:
-                lines.append(" ".join(current_line))
-            current_line = [word]
-            current_length = word_len
+    lines: list[str] = []
+    append = lines.append
+    join = " ".join
+    
+    # Length of the current line, counting one separating space per word
+    # (starts at -1 so the first word contributes only its own length)
+    start = 0
+    length = -1
+    for i, word in enumerate(words):
+        width = len(word) + 1
+        if length + width > line_width and i > start:
+            append(join(words[start:i]))
+            start = i
+            length = width - 1
         else:
-            current_line.append(word)
-            current_length += word_len + (1 if len(current_line) > 1 else 0)
+            length += width
     
     # Don't forget the last line
-    if current_line:
-        lines.append(" ".join(current_line))
+    if start < len(words):
+        append(join(words[start:]))
     
     return lines
 
@@ -182,6 +208,7 @@ class TaxonomicaGame:
     
     # All taxonomic ranks (in order)
     ALL_RANKS = ["kingdom", "phylum", "class", "order", "family", "genus", "species"]
+    ALL_RANKS_SET = frozenset(ALL_RANKS)
     
     # Progressive reveal defaults
     DEFAULT_INITIAL_CHUNKS = 3  # Lines or sentences to show initially
@@ -193,6 +220,10 @@ class TaxonomicaGame:
     MAX_GUESSES_PER_LEVEL = 5  # Max wrong guesses before auto-advance
     GUESS_CAP_PENALTY = 3  # Score penalty when guess cap is reached
     
+    # Separator lines reused on every frame
+    _EQ100 = "=" * 100
+    _DASH100 = "-" * 100
+    
     def __init__(
         self,
         tree: GBIFTaxonomyTree,
@@ -238,8 +269,15 @@ class TaxonomicaGame:
         # Start with initial chunks, but don't exceed total available
         self.visible_chunks = min(initial_chunks, len(self.chunks))
         
+        # Visible text is kept up to date as chunks are revealed.
+        # For lines, join with newlines; for sentences, join with spaces
+        self._join_sep = "\n" if reveal_mode == "lines" else " "
+        self._visible_text = self._join_sep.join(self.chunks[:self.visible_chunks])
+        
         # Build the correct path from root to target
         self.correct_path = list(reversed(target_species.get_path_to_root()))
+        # Built from the species end so the node nearest the root wins on duplicate ranks
+        self._correct_child_by_rank = {n.rank: n for n in reversed(self.correct_path)}
         
         # Current position in the tree
         self.current_node = tree.root
@@ -251,12 +289,22 @@ class TaxonomicaGame:
         self.penalty_points = 0  # Penalty points from guess cap
         self.guesses = 0  # Total guesses made
         self.revealed_ranks: set[str] = set()
+        self._revealed_up_to = 0  # Length of the revealed prefix of correct_path[1:]
         self.level_wrong_guesses = 0  # Wrong guesses at current level
         
         # Build redaction
         self.terms = build_redaction_terms_from_node(target_species)
         self.redactor = Redactor(self.terms, use_variable_length=True)
         
+        # Redacted text cache, keyed by (visible_chunks, redactor_version)
+        self._redactor_version = 0
+        self._red_cache_key: tuple[int, int] | None = None
+        self._red_cache_val = ""
+        
+        # Sorted choices cache, keyed by (current node, sort mode, rank)
+        self._choices_cache_key: tuple | None = None
+        self._choices_cache_val: list[TaxonomyNode] = []
+        
         # Display configuration
         self.display_config = NodeListDisplay(
             page=0,
@@ -265,6 +313,30 @@ class TaxonomicaGame:
             filter_complete_paths=True,
             show_complete_marker=False,  # Not needed in game mode
         )
+        
+        # Header block only depends on difficulty and seed, so build it once
+        difficulty_label = f"[{self.difficulty.upper()}]" if self.difficulty != "random" else ""
+        if self.seed_string and self.round_number:
+            seed_label = f" | Seed: \"{self.seed_string}\" Round {self.round_number}"
+        elif self.seed_string:
+            seed_label = f" | Seed: \"{self.seed_string}\""
+        else:
+            seed_label = ""
+        self._header_text = "\n".join([
+            self._EQ100,
+            f"  🌿 TAXONOMICA - Guess the Species! {difficulty_label}{seed_label} 🌿",
+            self._EQ100,
+        ])
+        
+        # Victory screen content never changes, so format it once
+        self._taxonomy_lines = []
+        for node in self.correct_path[1:]:  # Skip root
+            if node.rank in self.ALL_RANKS_SET:
+                vn = f' "{node.vernacular_names[0]}"' if node.vernacular_names else ""
+                # Mark if this rank was guessed or revealed
+                marker = "✓" if node.rank in self.game_ranks else " "
+                self._taxonomy_lines.append(f"  {marker} [{node.rank.upper():<8}] {node.name}{vn}")
+        self._victory_desc_wrapped = wrap_text(self.description[:2000], width=94)
     
     def get_current_rank(self) -> str:
         """Get the current rank we're guessing."""
@@ -274,11 +346,7 @@ class TaxonomicaGame:
     
     def get_correct_child(self) -> TaxonomyNode | None:
         """Get the correct child node at the current level."""
-        current_rank = self.get_current_rank()
-        for node in self.correct_path:
-            if node.rank == current_rank:
-                return node
-        return None
+        return self._correct_child_by_rank.get(self.get_current_rank())
     
     def get_choices(self) -> list[TaxonomyNode]:
         """Get the available choices at the current level."""
@@ -288,6 +356,12 @@ class TaxonomicaGame:
         
         # Use the shared sorting function, but filter to target rank
         self.display_config.filter_rank = target_rank
+        
+        # Paging doesn't change the sorted list, so reuse it across redraws
+        key = (id(self.current_node), self.display_config.sort_mode, target_rank)
+        if key == self._choices_cache_key:
+            return self._choices_cache_val
+        
         choices = get_sorted_children(
             self.current_node,
             sort_mode=self.display_config.sort_mode,
@@ -300,6 +374,8 @@ class TaxonomicaGame:
         if target_rank != "species":
             choices = [c for c in choices if c.children]
         
+        self._choices_cache_key = key
+        self._choices_cache_val = choices
         return choices
     
     def make_guess(self, choice: TaxonomyNode) -> bool:
@@ -308,10 +384,17 @@ class TaxonomicaGame:
         correct_child = self.get_correct_child()
         
         # Progressive reveal: add more chunks with each guess
-        self.visible_chunks = min(
-            self.visible_chunks + self.chunks_per_guess,
-            len(self.chunks)
-        )
+        chunks = self.chunks
+        prev_visible = self.visible_chunks
+        visible = min(prev_visible + self.chunks_per_guess, len(chunks))
+        self.visible_chunks = visible
+        if visible > prev_visible:
+            sep = self._join_sep
+            new_text = sep.join(chunks[prev_visible:visible])
+            if prev_visible:
+                self._visible_text += sep + new_text
+            else:
+                self._visible_text = new_text
         
         if choice == correct_child:
             # Correct! Reveal this rank and advance
@@ -328,6 +411,16 @@ class TaxonomicaGame:
         """Advance to the next level after correct guess or guess cap."""
         self.revealed_ranks.add(self.get_current_rank())
         self.redactor.reveal_rank(self.get_current_rank())
+        self._redactor_version += 1
+        self._choices_cache_key = None
+        
+        # Extend the revealed path prefix (stops at the first unrevealed rank)
+        path = self.correct_path
+        while (
+            self._revealed_up_to + 1 < len(path)
+            and path[self._revealed_up_to + 1].rank in self.revealed_ranks
+        ):
+            self._revealed_up_to += 1
         self.current_node = node
         self.current_rank_index += 1
         self.display_config.page = 0  # Reset page for new level
@@ -356,66 +449,80 @@ class TaxonomicaGame:
     
     def get_visible_text(self) -> str:
         """Get the currently visible portion of the description."""
-        visible = self.chunks[:self.visible_chunks]
-        # For lines, join with newlines; for sentences, join with spaces
-        if self.reveal_mode == "lines":
-            return "\n".join(visible)
-        return " ".join(visible)
+        return self._visible_text
     
     def get_redacted_description(self) -> str:
-        """Get the visible description with current redaction level."""
-        visible_text = self.get_visible_text()
-        return self.redactor.redact(visible_text)
+        """Get the visible description with current redaction level.
+        
+        The result is cached. In lines mode, when only new lines were
+        revealed since the last call, just those lines are redacted and
+        appended.
+        """
+        key = (self.visible_chunks, self._redactor_version)
+        cached_key = self._red_cache_key
+        if key == cached_key:
+            return self._red_cache_val
+        
+        if (
+            self.reveal_mode == "lines"
+            and cached_key is not None
+            and cached_key[1] == self._redactor_version
+            and 0 < cached_key[0] < self.visible_chunks
+        ):
+            # Lines are joined with newlines, which no term contains, so
+            # redacting the new lines on their own matches a full
+            # re-redaction. Sentences are not: a name such as
+            # "Helena Island. Bird" can be split across two of them.
+            sep = self._join_sep
+            new_text = sep.join(self.chunks[cached_key[0]:self.visible_chunks])
+            redacted = self.redactor.redact_append(self._red_cache_val, new_text, sep)
+        else:
+            redacted = self.redactor.redact(self.get_visible_text())
+        
+        self._red_cache_key = key
+        self._red_cache_val = redacted
+        return redacted
     
     def display(self) -> list[TaxonomyNode]:
         """Display the current game state. Returns available choices."""
         clear_screen()
         
+        # Collect the whole frame and write it at once
+        parts: list[str] = []
+        append = parts.append
+        
         # Header
-        print("=" * 100)
-        difficulty_label = f"[{self.difficulty.upper()}]" if self.difficulty != "random" else ""
-        if self.seed_string and self.round_number:
-            seed_label = f" | Seed: \"{self.seed_string}\" Round {self.round_number}"
-        elif self.seed_string:
-            seed_label = f" | Seed: \"{self.seed_string}\""
-        else:
-            seed_label = ""
-        print(f"  🌿 TAXONOMICA - Guess the Species! {difficulty_label}{seed_label} 🌿")
-        print("=" * 100)
+        append(self._header_text)
         
         # Score and progress
-        print(f"\n  Score: {self.score} wrong guesses | Progress: {self.current_rank_index}/{len(self.game_ranks)} ranks")
+        append(f"\n  Score: {self.score} wrong guesses | Progress: {self.current_rank_index}/{len(self.game_ranks)} ranks")
         
         # Current path (revealed portions only)
-        if self.revealed_ranks:
+        if self._revealed_up_to:
             path_parts = []
-            for node in self.correct_path[1:]:  # Skip root
-                if node.rank in self.revealed_ranks:
-                    vn = f' "{node.vernacular_names[0]}"' if node.vernacular_names else ""
-                    path_parts.append(f"{node.name}{vn}")
-                else:
-                    break
-            if path_parts:
-                print(f"  Path: {' → '.join(path_parts)}")
+            for node in self.correct_path[1:1 + self._revealed_up_to]:  # Skip root
+                vn = f' "{node.vernacular_names[0]}"' if node.vernacular_names else ""
+                path_parts.append(f"{node.name}{vn}")
+            append(f"  Path: {' → '.join(path_parts)}")
         
         # Redacted description with progressive reveal info
         total_chunks = len(self.chunks)
         chunk_label = f"{self.chunk_name}s" if total_chunks != 1 else self.chunk_name
-        print("\n" + "-" * 100)
-        print(f"  MYSTERY SPECIES DESCRIPTION:  (showing {self.visible_chunks}/{total_chunks} {chunk_label})")
-        print("-" * 100)
+        append("")
+        append(self._DASH100)
+        append(f"  MYSTERY SPECIES DESCRIPTION:  (showing {self.visible_chunks}/{total_chunks} {chunk_label})")
+        append(self._DASH100)
         redacted = self.get_redacted_description()
         # For lines mode, text is already line-broken; for sentences, wrap it
         if self.reveal_mode == "lines":
             # Add indent to each line
-            for line in redacted.split("\n"):
-                print(f"  {line}")
+            append("  " + redacted.replace("\n", "\n  "))
         else:
-            print(wrap_text(redacted, width=94))
+            append(wrap_text(redacted, width=94))
         # Show ellipsis if more content available
         if self.visible_chunks < total_chunks:
-            print("  ...")
-        print("-" * 100)
+            append("  ...")
+        append(self._DASH100)
         
         # Current guessing level
         current_rank = self.get_current_rank()
@@ -424,21 +531,23 @@ class TaxonomicaGame:
         if current_rank != "complete":
             sort_name = SORT_MODE_NAMES[self.display_config.sort_mode]
             guesses_left = self.MAX_GUESSES_PER_LEVEL - self.level_wrong_guesses
-            print(f"\n  Choose the correct {current_rank.upper()}:  ({guesses_left} guesses left, sorted: {sort_name})")
+            append(f"\n  Choose the correct {current_rank.upper()}:  ({guesses_left} guesses left, sorted: {sort_name})")
             
             choices = self.get_choices()
             
-            # Use shared display function
-            display_node_list(
+            # Use shared formatting function
+            parts.extend(format_node_list(
                 choices,
                 self.display_config,
                 header=f"Options ({len(choices)} total):",
-            )
+            ))
             
             # Command bar
-            print("-" * 100)
-            print("  [a-z] select | [I] or [I+letter] info | [N]ext/[P]rev page | [S] sort | [Q] quit")
-            print("=" * 100)
+            append(self._DASH100)
+            append("  [a-z] select | [I] or [I+letter] info | [N]ext/[P]rev page | [S] sort | [Q] quit")
+            append(self._EQ100)
+        
+        sys.stdout.write("\n".join(parts) + "\n")
         
         return choices
     
@@ -446,12 +555,12 @@ class TaxonomicaGame:
         """Display the victory screen."""
         clear_screen()
         
-        print("=" * 100)
+        print(self._EQ100)
         if self.end_at_genus:
             print("  🎉 CONGRATULATIONS! You identified the genus! 🎉")
         else:
             print("  🎉 CONGRATULATIONS! You identified the species! 🎉")
-        print("=" * 100)
+        print(self._EQ100)
         
         # Final score
         # Show detailed score breakdown
@@ -485,23 +594,17 @@ class TaxonomicaGame:
         
         # Show full path (including ranks not guessed)
         print("\n  Complete taxonomy:")
-        for node in self.correct_path[1:]:  # Skip root
-            if node.rank in self.ALL_RANKS:
-                vn = f' "{node.vernacular_names[0]}"' if node.vernacular_names else ""
-                # Mark if this rank was guessed or revealed
-                if node.rank in self.game_ranks:
-                    print(f"  ✓ [{node.rank.upper():<8}] {node.name}{vn}")
-                else:
-                    print(f"    [{node.rank.upper():<8}] {node.name}{vn}")
+        if self._taxonomy_lines:
+            print("\n".join(self._taxonomy_lines))
         
         # Show more of the description (since we have much more content now)
-        print("\n" + "-" * 100)
+        print("\n" + self._DASH100)
         print("  FULL DESCRIPTION (excerpt):")
-        print("-" * 100)
-        print(wrap_text(self.description[:2000], width=94))
+        print(self._DASH100)
+        print(self._victory_desc_wrapped)
         if len(self.description) > 2000:
             print(f"\n  ... and {len(self.description) - 2000:,} more characters ...")
-        print("-" * 100)
+        print(self._DASH100)
     
     def _handle_input(self, choice: str, choices: list[TaxonomyNode]) -> tuple[str, TaxonomyNode | None]:
         """Handle user input and return (action, selected_node)."""
@@ -545,40 +648,55 @@ class TaxonomicaGame:
         """Display Wikipedia information about a taxon."""
         clear_screen()
         
-        print("=" * 100)
-        print(f"  📖 INFORMATION: {node.name}")
-        print("=" * 100)
+        # Collect the whole screen and write it at once
+        parts: list[str] = []
+        append = parts.append
+        
+        append(self._EQ100)
+        append(f"  📖 INFORMATION: {node.name}")
+        append(self._EQ100)
         
         if node.vernacular_names:
-            print(f"\n  Common name: {node.vernacular_names[0]}")
-        print(f"  Rank: {node.rank}")
-        print(f"  Descendants: {node.count_descendants():,}")
+            append(f"\n  Common name: {node.vernacular_names[0]}")
+        append(f"  Rank: {node.rank}")
+        append(f"  Descendants: {node.count_descendants():,}")
         
         # Try to get Wikipedia description
         wiki_entry = self.wiki.match_gbif_taxon(node.name)
         if wiki_entry:
             description = wiki_entry.get_useful_text() or wiki_entry.get_abstract()
             if description:
-                print("\n" + "-" * 100)
-                print("  WIKIPEDIA DESCRIPTION:")
-                print("-" * 100)
+                append("\n" + self._DASH100)
+                append("  WIKIPEDIA DESCRIPTION:")
+                append(self._DASH100)
                 # Show more text for info view
-                print(wrap_text(description[:3000], width=94))
+                append(wrap_text(description[:3000], width=94))
                 if len(description) > 3000:
-                    print(f"\n  ... and {len(description) - 3000:,} more characters ...")
-                print("-" * 100)
+                    append(f"\n  ... and {len(description) - 3000:,} more characters ...")
+                append(self._DASH100)
             else:
-                print("\n  (No description available)")
+                append("\n  (No description available)")
         else:
-            print("\n  (No Wikipedia entry found for this taxon)")
+            append("\n  (No Wikipedia entry found for this taxon)")
         
-        print("\n" + "=" * 100)
+        append("\n" + self._EQ100)
+        sys.stdout.write("\n".join(parts) + "\n")
         input("  Press Enter to return to the game...")
     
     def run(self) -> None:
         """Run the game loop."""
-        while not self.is_complete():
-            choices = self.display()
+        # Bind frequently used attributes once for the input loop
+        display = self.display
+        is_complete = self.is_complete
+        handle_input = self._handle_input
+        show_taxon_info = self.show_taxon_info
+        make_guess = self.make_guess
+        cfg = self.display_config  # Mutated in place, so safe to bind
+        target = self.target
+        max_guesses = self.MAX_GUESSES_PER_LEVEL
+        
+        while not is_complete():
+            choices = display()
             
             if not choices:
                 print("\n  No valid choices available!")
@@ -588,13 +706,13 @@ class TaxonomicaGame:
             try:
                 choice_input = input("\n  Your choice: ").strip()
             except (KeyboardInterrupt, EOFError):
-                print(f"\n  Game ended. The species was: {self.target.name}")
+                print(f"\n  Game ended. The species was: {target.name}")
                 return
             
             # Check for info command: [I] for current node, [I+letter] for choice
             if choice_input.upper() == 'I':
                 # Show info about the current node (where we are now)
-                self.show_taxon_info(self.current_node)
+                show_taxon_info(self.current_node)
                 continue
             
             if len(choice_input) == 2 and choice_input[0].upper() == 'I':
@@ -608,9 +726,9 @@ class TaxonomicaGame:
                 letter = choice_input[1].lower()
                 if 'a' <= letter <= 'z':
                     idx = ord(letter) - ord('a')
-                    absolute_idx = self.display_config.page * self.display_config.page_size + idx
+                    absolute_idx = cfg.page * cfg.page_size + idx
                     if 0 <= absolute_idx < len(choices):
-                        self.show_taxon_info(choices[absolute_idx])
+                        show_taxon_info(choices[absolute_idx])
                         continue
                     else:
                         print("  Invalid choice.")
@@ -619,12 +737,12 @@ class TaxonomicaGame:
             
             # Handle standard commands using shared function
             # We need to simulate the input since we already read it
-            action, selected = self._handle_input(choice_input, choices)
+            action, selected = handle_input(choice_input, choices)
             
             if action == "quit":
-                print(f"\n  Game ended. The species was: {self.target.name}")
-                if self.target.vernacular_names:
-                    print(f"  Common name: {self.target.vernacular_names[0]}")
+                print(f"\n  Game ended. The species was: {target.name}")
+                if target.vernacular_names:
+                    print(f"  Common name: {target.vernacular_names[0]}")
                 return
             
             if action == "refresh":
@@ -638,7 +756,7 @@ class TaxonomicaGame:
                 # Track chunks before guess for feedback
                 chunks_before = self.visible_chunks
                 
-                correct = self.make_guess(selected)
+                correct = make_guess(selected)
                 
                 # Check if new content was revealed
                 new_chunks = self.visible_chunks - chunks_before
@@ -663,7 +781,7 @@ class TaxonomicaGame:
                         print(f"    (+{self.GUESS_CAP_PENALTY} penalty, advancing to next level)")
                         input("  Press Enter to continue...")
                     else:
-                        guesses_remaining = self.MAX_GUESSES_PER_LEVEL - self.level_wrong_guesses
+                        guesses_remaining = max_guesses - self.level_wrong_guesses
                         print(f"\n  ✗ Wrong!{reveal_msg} ({guesses_remaining} guesses left)")
                         print(f"    (The correct answer is still among the choices)")
                         input("  Press Enter to try again...")
@@ -673,6 +791,22 @@ class TaxonomicaGame:
         input("\n  Press Enter to exit...")
 
 
+def build_species_index(tree: GBIFTaxonomyTree) -> list[TaxonomyNode]:
+    """Collect all species with complete paths, sorted by ID.
+    
+    Sorting by ID gives a deterministic order, which seeded selection relies on.
+    
+    Args:
+        tree: The GBIF taxonomy tree.
+        
+    Returns:
+        List of species nodes with complete taxonomic paths.
+    """
+    species = tree.get_complete_path_nodes("species")
+    species.sort(key=lambda n: n.id)
+    return species
+
+
 def find_species_with_wikipedia(
     tree: GBIFTaxonomyTree,
     wiki: WikipediaData,
@@ -680,6 +814,7 @@ def find_species_with_wikipedia(
     difficulty: str = "expert",
     seed: int | None = None,
     max_attempts: int = 200,
+    all_species: list[TaxonomyNode] | None = None,
 ) -> tuple[TaxonomyNode, str] | None:
     """Find a random species that has a Wikipedia entry with description.
     
@@ -692,76 +827,63 @@ def find_species_with_wikipedia(
         seed: Optional integer seed for deterministic species selection.
               If provided, the same seed + difficulty will always select the same species.
         max_attempts: Maximum number of species to try.
+        all_species: Optional precomputed list of species nodes with complete
+                     paths, sorted by ID. Avoids rescanning the tree each round.
     
     Returns:
         Tuple of (node, description) or None if not found.
     """
-    # Difficulty thresholds (inclusive - each tier includes easier tiers)
-    DIFFICULTY_THRESHOLDS = {
-        "easy": 55,    # Top 1%
-        "medium": 49,  # Top 5%
-        "hard": 24,    # Top 25%
-        "expert": 0,   # All species
-    }
-    
     min_score = DIFFICULTY_THRESHOLDS.get(difficulty, 0)
     
     # Pre-filter: Build list of candidate species names from popularity index
-    # This is MUCH faster than random sampling when filtering by difficulty
-    candidate_names: set[str] | None = None
+    # This is MUCH faster than random sampling when filtering by difficulty.
+    # The index caches these per difficulty, so replays don't rebuild them
+    candidate_names: frozenset[str] | None = None
     if difficulty != "expert" and popularity_index and min_score > 0:
-        candidate_names = set()
-        for metrics in popularity_index._by_id.values():
-            if metrics.popularity_score >= min_score and metrics.section_count >= 2:
-                candidate_names.add(metrics.scientific_name.lower())
-    
-    # Get species nodes, optionally filtered by difficulty candidates
-    species_nodes = []
-    for node in tree._nodes_by_id.values():
-        if node.rank == "species" and node.has_complete_path():
-            # If filtering by difficulty, only include candidates
-            if candidate_names is not None:
-                if node.name.lower() not in candidate_names:
-                    continue
-            species_nodes.append(node)
+        candidate_names = popularity_index.candidates_for(difficulty)
+    
+    if all_species is None:
+        all_species = build_species_index(tree)
+    
+    # Filter by difficulty candidates
+    if candidate_names is not None:
+        species_nodes = [n for n in all_species if n.name.lower() in candidate_names]
+    else:
+        species_nodes = all_species
     
     print(f"  Found {len(species_nodes):,} eligible species")
     
     if not species_nodes:
         return None
     
-    # Sort by ID for deterministic ordering (important for seeded selection)
-    species_nodes.sort(key=lambda n: n.id)
-    
     # Create a random generator (seeded if provided)
     if seed is not None:
         rng = random.Random(seed)
     else:
         rng = random.Random()
     
-    # Shuffle the list deterministically
-    rng.shuffle(species_nodes)
+    # Draw only the candidates we may try (deterministic for a given seed)
+    pool = rng.sample(species_nodes, k=min(max_attempts, len(species_nodes)))
     
     # Try species in order until we find one with a Wikipedia entry
-    attempts = 0
-    
-    for node in species_nodes[:max_attempts]:
-        attempts += 1
-        
+    for attempts, node in enumerate(pool, 1):
         # Progress indicator (only show if taking a while)
         if attempts % 100 == 0:
             print(f"    Searching...")
         
         # Try to find Wikipedia entry
         wiki_species = wiki.match_gbif_taxon(node.name)
-        if wiki_species:
-            # Use useful text (excludes species lists, galleries, etc.)
-            full_text = wiki_species.get_useful_text()
-            if full_text and len(full_text) > 400:  # Require substantive description
-                # Check we have enough lines for progressive reveal
-                lines = split_into_lines(full_text)
-                if len(lines) >= 12:  # Need enough lines for many guesses
-                    return node, full_text
+        # Raw length bounds the useful text length, so skip short entries
+        # before cleaning any text
+        if wiki_species is None or wiki_species.raw_text_length < 12 * 90:
+            continue
+        
+        # Use useful text (excludes species lists, galleries, etc.)
+        full_text = wiki_species.get_useful_text()
+        # Require a substantive description with enough text for ~12
+        # lines of progressive reveal (line_width=90), without wrapping it
+        if full_text and len(full_text) >= 12 * 90:
+            return node, full_text
     
     return None
 
@@ -870,6 +992,9 @@ def main():
     print("\n  Loading vernacular names...")
     tree.add_vernacular_names(backbone)
     
+    # Species eligible for play, computed once and reused every round
+    all_species = build_species_index(tree)
+    
     print("\n  Loading Wikipedia data...")
     wiki = WikipediaData(wiki_path)
     
@@ -903,7 +1028,10 @@ def main():
             round_seed = None
             print(f"\n  Loading...")
         
-        result = find_species_with_wikipedia(tree, wiki, popularity_index, difficulty, seed=round_seed)
+        result = find_species_with_wikipedia(
+            tree, wiki, popularity_index, difficulty,
+            seed=round_seed, all_species=all_species,
+        )
         
         if not result:
             print("  ERROR: Could not find a species with Wikipedia entry.")
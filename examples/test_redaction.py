@@ -7,13 +7,21 @@ descriptions, which is core to the Taxonomica game mechanic.
 
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from taxonomica.dwca import DarwinCoreArchive
+from taxonomica.redaction import TermMatcher
+
 # Redaction marker - could be customized
 REDACTED = "█████"
 
+# HTML cleanup patterns
+_BR_RE = re.compile(r'<br\s*/?>')
+_TAG_RE = re.compile(r'<[^>]+>')
+
 
 def get_cat_taxonomy() -> dict[str, list[str]]:
     """Get the full taxonomic hierarchy for domestic cat with vernacular names.
@@ -42,7 +50,7 @@ def get_cat_taxonomy() -> dict[str, list[str]]:
     }
 
 
-def build_redaction_patterns(taxonomy: dict[str, list[str]], redact_levels: set[str]) -> list[tuple[re.Pattern, str]]:
+def build_redaction_patterns(taxonomy: dict[str, list[str]], redact_levels: set[str]) -> list[tuple[TermMatcher, str]]:
     """Build regex patterns for redaction.
     
     Args:
@@ -50,33 +58,39 @@ def build_redaction_patterns(taxonomy: dict[str, list[str]], redact_levels: set[
         redact_levels: Set of levels to redact (e.g., {"species", "genus", "family"})
     
     Returns:
-        List of (pattern, replacement) tuples
+        List of (matcher, replacement) tuples (a single combined matcher,
+        or empty if there is nothing to redact)
     """
-    patterns = []
+    terms = []
     
     for level in redact_levels:
         # Scientific names
         if level in taxonomy:
-            for term in taxonomy[level]:
-                # Word boundary matching, case-insensitive
-                # Use word boundaries to avoid matching "cat" in "category"
-                pattern = re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
-                patterns.append((pattern, REDACTED))
+            terms.extend(taxonomy[level])
         
         # Vernacular names
         vernacular_key = f"vernacular_{level}"
         if vernacular_key in taxonomy:
-            for term in taxonomy[vernacular_key]:
-                pattern = re.compile(r'\b' + re.escape(term) + r'\b', re.IGNORECASE)
-                patterns.append((pattern, REDACTED))
+            terms.extend(taxonomy[vernacular_key])
     
-    # Sort by length (longest first) to avoid partial replacements
-    patterns.sort(key=lambda x: -len(x[0].pattern))
+    if not terms:
+        return []
     
-    return patterns
+    return [(_build_matcher(frozenset(terms)), REDACTED)]
 
 
-def redact_text(text: str, patterns: list[tuple[re.Pattern, str]]) -> str:
+@lru_cache(maxsize=32)
+def _build_matcher(terms: frozenset[str]) -> TermMatcher:
+    """Build one matcher for all terms, so the text is scanned once.
+    
+    The longest term wins at each position (e.g. "domestic cat" over "cat").
+    Word boundaries avoid matching "cat" in "category"; case-insensitive.
+    Cached, since the same term sets recur across redaction scenarios.
+    """
+    return TermMatcher(terms, word_boundaries=True)
+
+
+def redact_text(text: str, patterns: list[tuple[TermMatcher, str]]) -> str:
     """Apply redaction patterns to text."""
     result = text
     for pattern, replacement in patterns:
@@ -87,18 +101,12 @@ def redact_text(text: str, patterns: list[tuple[re.Pattern, str]]) -> str:
 def get_cat_description() -> str:
     """Load the cat description from Wikipedia data."""
     wiki_path = Path(__file__).parent.parent / "wikipedia-en-dwca"
-    desc_file = wiki_path / "description.txt"
+    archive = DarwinCoreArchive(wiki_path)
     
     # Cat taxon ID is 6678
-    taxon_id = "6678"
-    
-    with open(desc_file, encoding="utf-8") as f:
-        for line in f:
-            parts = line.strip().split("\t")
-            if len(parts) >= 4 and parts[0] == taxon_id:
-                section_type = parts[2]
-                if section_type == "Abstract":
-                    return parts[3]
+    for desc in archive.iter_descriptions(taxon_ids={"6678"}):
+        if desc.type == "Abstract":
+            return desc.description
     
     return ""
 
@@ -119,8 +127,8 @@ def main():
         return
     
     # Clean up HTML tags for readability
-    description = re.sub(r'<br\s*/?>', '\n', description)
-    description = re.sub(r'<[^>]+>', '', description)
+    description = _BR_RE.sub('\n', description)
+    description = _TAG_RE.sub('', description)
     
     print("\n" + "-" * 80)
     print("ORIGINAL DESCRIPTION (first 800 chars):")
@@ -35,6 +35,7 @@ from taxonomica.wikipedia import (
 from taxonomica.redaction import (
     Redactor,
     RedactionTerms,
+    TermMatcher,
     build_redaction_terms_from_node,
     build_redaction_terms_manual,
 )
@@ -51,6 +52,7 @@ from taxonomica.ui import (
     SortMode,
     clear_screen,
     display_node_list,
+    format_node_list,
     format_rank,
     get_sorted_children,
     get_user_choice,
@@ -84,6 +86,7 @@ __all__ = [
     # Redaction
     "Redactor",
     "RedactionTerms",
+    "TermMatcher",
     "build_redaction_terms_from_node",
     "build_redaction_terms_manual",
     # UI
@@ -91,6 +94,7 @@ __all__ = [
     "SortMode",
     "clear_screen",
     "display_node_list",
+    "format_node_list",
     "format_rank",
     "get_sorted_children",
     "get_user_choice",
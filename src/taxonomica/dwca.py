@@ -14,20 +14,60 @@ Reference: https://en.wikipedia.org/wiki/Darwin_Core_Archive
 from __future__ import annotations
 
 import csv
+import mmap
+import os
+import sys
 import xml.etree.ElementTree as ET
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Collection, Iterator
+
+    import pyarrow as pa
 
 
 # Darwin Core namespace
 DWC_NS = "http://rs.tdwg.org/dwc/text/"
 
-
-@dataclass
+# Qualified meta.xml tag names
+_TAG_CORE = f"{{{DWC_NS}}}core"
+_TAG_EXTENSION = f"{{{DWC_NS}}}extension"
+_TAG_FILES = f"{{{DWC_NS}}}files"
+_TAG_LOCATION = f"{{{DWC_NS}}}location"
+_TAG_FIELD = f"{{{DWC_NS}}}field"
+_TAG_ID = f"{{{DWC_NS}}}id"
+_TAG_COREID = f"{{{DWC_NS}}}coreid"
+
+# Values of boolean fields that count as true
+_TRUE_VALUES = ("true", "yes", "1")
+
+# Low-cardinality fields whose values are interned as rows are parsed, so
+# records share one string object per distinct value
+_INTERNED_FIELDS = frozenset({
+    "rank",
+    "verbatim_rank",
+    "kingdom",
+    "phylum",
+    "class_",
+    "order",
+    "family",
+    "taxonomic_status",
+    "language",
+    "type",
+    "license",
+    "type_status",
+})
+
+# Up to this many taxon IDs, filtered extension reads scan the raw bytes of
+# the file for each ID instead of decoding and splitting every line
+_SCAN_MAX_TAXON_IDS = 32
+
+
+@dataclass(slots=True)
 class FieldDefinition:
     """Definition of a field/column in a DwC-A file."""
 
@@ -43,7 +83,7 @@ class FieldDefinition:
         return self.term.rsplit("/", 1)[-1]
 
 
-@dataclass
+@dataclass(slots=True)
 class FileDescriptor:
     """Descriptor for a file within the archive."""
 
@@ -57,14 +97,33 @@ class FileDescriptor:
     id_index: int | None  # For core file
     coreid_index: int | None  # For extension files
     fields: list[FieldDefinition] = field(default_factory=list)
+    name_to_index: dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        # Index fields by name once; the first definition of a name wins
+        if not self.name_to_index:
+            self.name_to_index = {fd.name: fd.index for fd in reversed(self.fields)}
 
     @property
     def is_core(self) -> bool:
         """Check if this is the core file (has id) vs extension (has coreid)."""
         return self.id_index is not None
 
+    @property
+    def is_unquoted_utf8(self) -> bool:
+        """Check if rows can be found by scanning raw bytes for newlines.
 
-@dataclass
+        True for unquoted, tab- or comma-delimited UTF-8 files, where a
+        newline byte always ends a row.
+        """
+        return (
+            not self.fields_enclosed_by
+            and self.fields_terminated_by in ("\t", ",")
+            and self.encoding.lower() in ("utf-8", "utf8")
+        )
+
+
+@dataclass(slots=True)
 class Taxon:
     """A taxonomic record from the core taxon file."""
 
@@ -91,7 +150,7 @@ class Taxon:
     taxonomic_status: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class VernacularName:
     """A vernacular (common) name for a taxon."""
 
@@ -101,7 +160,7 @@ class VernacularName:
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeciesProfile:
     """Species profile information (extinction status, living period)."""
 
@@ -110,7 +169,7 @@ class SpeciesProfile:
     living_period: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Multimedia:
     """Multimedia (image) record for a taxon."""
 
@@ -127,7 +186,7 @@ class Multimedia:
     source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Description:
     """Text description for a taxon."""
 
@@ -139,7 +198,7 @@ class Description:
     license: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class TypeSpecimen:
     """Type specimen record for a taxon."""
 
@@ -148,6 +207,94 @@ class TypeSpecimen:
     type_status: str = ""
 
 
+# Record attribute -> DwC term name, per row type (the taxon/core ID
+# attribute comes from the id/coreid column)
+_TAXON_FIELDS = {
+    "references": "references",
+    "modified": "modified",
+    "scientific_name": "scientificName",
+    "scientific_name_authorship": "scientificNameAuthorship",
+    "rank": "taxonRank",
+    "verbatim_rank": "verbatimTaxonRank",
+    "kingdom": "kingdom",
+    "phylum": "phylum",
+    "class_": "class",
+    "order": "order",
+    "family": "family",
+    "genus": "genus",
+    "subgenus": "subgenus",
+    "taxon_remarks": "taxonRemarks",
+    "trend": "trend",
+    "fossil_range": "fossilRange",
+    "taxobox": "taxobox",
+    "accepted_name_usage": "acceptedNameUsage",
+    "accepted_name_usage_id": "acceptedNameUsageID",
+    "taxonomic_status": "taxonomicStatus",
+}
+
+_VERNACULAR_NAME_FIELDS = {
+    "is_preferred": "isPreferredName",
+    "language": "language",
+    "name": "vernacularName",
+}
+
+_SPECIES_PROFILE_FIELDS = {
+    "is_extinct": "isExtinct",
+    "living_period": "livingPeriod",
+}
+
+_MULTIMEDIA_FIELDS = {
+    "title": "title",
+    "created": "created",
+    "type": "type",
+    "identifier": "identifier",
+    "creator": "creator",
+    "references": "references",
+    "description": "description",
+    "publisher": "publisher",
+    "license": "license",
+    "source": "source",
+}
+
+_DESCRIPTION_FIELDS = {
+    "language": "language",
+    "type": "type",
+    "description": "description",
+    "references": "references",
+    "license": "license",
+}
+
+_TYPE_SPECIMEN_FIELDS = {
+    "scientific_name": "scientificName",
+    "type_status": "typeStatus",
+}
+
+
+def _count_ranks_in_range(
+    file_path: Path, start: int, end: int, delimiter: str, rank_index: int | None
+) -> Counter[str]:
+    """Count the ranks of the rows in a newline-aligned byte range of a data file.
+
+    Runs in a worker process for DarwinCoreArchive.get_rank_distribution_parallel().
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start).decode("utf-8")
+
+    distribution: Counter[str] = Counter()
+    for line in data.split("\n"):
+        line = line.rstrip("\r")
+        if not line:
+            continue
+        if rank_index is None:
+            rank = ""
+        else:
+            row = line.split(delimiter, rank_index + 1)
+            rank = row[rank_index] if rank_index < len(row) else ""
+        distribution[rank or "unknown"] += 1
+    return distribution
+
+
 class DarwinCoreArchive:
     """Parser for Darwin Core Archive files.
 
@@ -170,6 +317,8 @@ class DarwinCoreArchive:
         self._meta: ET.Element | None = None
         self._core: FileDescriptor | None = None
         self._extensions: dict[str, FileDescriptor] = {}
+        # Generated row parsers, keyed by row type
+        self._row_parsers: dict[str, Callable[[list[str]], object]] = {}
         self._parse_meta()
 
     def _parse_meta(self) -> None:
@@ -178,31 +327,36 @@ class DarwinCoreArchive:
         if not meta_path.exists():
             raise FileNotFoundError(f"meta.xml not found in {self.path}")
 
-        tree = ET.parse(meta_path)
-        self._meta = tree.getroot()
-
-        # Parse core file descriptor
-        core_elem = self._meta.find(f"{{{DWC_NS}}}core")
-        if core_elem is not None:
-            self._core = self._parse_file_descriptor(core_elem, is_core=True)
-
-        # Parse extension file descriptors
-        for ext_elem in self._meta.findall(f"{{{DWC_NS}}}extension"):
-            ext_desc = self._parse_file_descriptor(ext_elem, is_core=False)
-            self._extensions[ext_desc.row_type] = ext_desc
+        # Stream the descriptor, parsing each core/extension element as it
+        # completes and discarding its children afterwards
+        for event, elem in ET.iterparse(meta_path, events=("start", "end")):
+            if event == "start":
+                if self._meta is None:
+                    self._meta = elem
+                continue
+
+            if elem.tag == _TAG_CORE:
+                # Only the first core element is used
+                if self._core is None:
+                    self._core = self._parse_file_descriptor(elem, is_core=True)
+                elem.clear()
+            elif elem.tag == _TAG_EXTENSION:
+                ext_desc = self._parse_file_descriptor(elem, is_core=False)
+                self._extensions[ext_desc.row_type] = ext_desc
+                elem.clear()
 
     def _parse_file_descriptor(
         self, element: ET.Element, *, is_core: bool
     ) -> FileDescriptor:
         """Parse a file descriptor from an XML element."""
         # Get file location
-        files_elem = element.find(f"{{{DWC_NS}}}files")
-        location_elem = files_elem.find(f"{{{DWC_NS}}}location") if files_elem else None
+        files_elem = element.find(_TAG_FILES)
+        location_elem = files_elem.find(_TAG_LOCATION) if files_elem else None
         location = location_elem.text if location_elem is not None else ""
 
         # Parse fields
         fields = []
-        for field_elem in element.findall(f"{{{DWC_NS}}}field"):
+        for field_elem in element.findall(_TAG_FIELD):
             idx = int(field_elem.get("index", 0))
             term = field_elem.get("term", "")
             fields.append(FieldDefinition(index=idx, term=term))
@@ -214,11 +368,11 @@ class DarwinCoreArchive:
         id_index = None
         coreid_index = None
         if is_core:
-            id_elem = element.find(f"{{{DWC_NS}}}id")
+            id_elem = element.find(_TAG_ID)
             if id_elem is not None:
                 id_index = int(id_elem.get("index", 0))
         else:
-            coreid_elem = element.find(f"{{{DWC_NS}}}coreid")
+            coreid_elem = element.find(_TAG_COREID)
             if coreid_elem is not None:
                 coreid_index = int(coreid_elem.get("index", 0))
 
@@ -246,6 +400,14 @@ class DarwinCoreArchive:
 
     def _iter_rows(self, descriptor: FileDescriptor) -> Iterator[list[str]]:
         """Iterate over rows in a data file."""
+        if descriptor.is_unquoted_utf8:
+            # Splitting bytes and decoding each field beats decoding the
+            # line first; tabs and commas never occur inside UTF-8 sequences
+            decode = bytes.decode
+            for raw in self._iter_raw_rows(descriptor):
+                yield [decode(value) for value in raw]
+            return
+
         file_path = self.path / descriptor.location
         if not file_path.exists():
             return
@@ -255,19 +417,184 @@ class DarwinCoreArchive:
             for _ in range(descriptor.ignore_header_lines):
                 next(f, None)
 
-            reader = csv.reader(f, delimiter=descriptor.fields_terminated_by)
+            delimiter = descriptor.fields_terminated_by
+            if not descriptor.fields_enclosed_by and delimiter in ("\t", ","):
+                # Unquoted data: a plain split is much faster than csv.reader
+                # and leaves literal quote characters untouched
+                for line in f:
+                    line = line.rstrip("\r\n")
+                    if line:
+                        yield line.split(delimiter)
+                return
+
+            reader = csv.reader(f, delimiter=delimiter)
             yield from reader
 
-    def _get_field_value(
-        self, row: list[str], fields: list[FieldDefinition], field_name: str
-    ) -> str:
-        """Get a field value from a row by field name."""
-        for field_def in fields:
-            if field_def.name == field_name:
-                if field_def.index < len(row):
-                    return row[field_def.index]
-                return ""
-        return ""
+    def _iter_raw_rows(self, descriptor: FileDescriptor) -> Iterator[list[bytes]]:
+        """Iterate over rows of an unquoted UTF-8 file as undecoded fields.
+
+        Callers decode only the fields they need. Only valid for descriptors
+        where is_unquoted_utf8 is true.
+        """
+        file_path = self.path / descriptor.location
+        if not file_path.exists():
+            return
+
+        with open(file_path, "rb") as f:
+            for _ in range(descriptor.ignore_header_lines):
+                next(f, None)
+
+            delimiter = descriptor.fields_terminated_by.encode()
+            for line in f:
+                line = line.rstrip(b"\r\n")
+                if line:
+                    yield line.split(delimiter)
+
+    def _iter_rows_for_taxa(
+        self, descriptor: FileDescriptor, taxon_ids: Collection[str] | None
+    ) -> Iterator[list[str]]:
+        """Iterate over extension rows, keeping only those for the given taxa.
+
+        Rows are filtered on their core ID before any record is built, so
+        callers interested in a few taxa skip the rest of the file cheaply.
+        """
+        if taxon_ids is None:
+            return self._iter_rows(descriptor)
+
+        coreid_index = descriptor.coreid_index
+        if coreid_index is None:
+            return iter(())
+        if (
+            coreid_index == 0
+            and len(taxon_ids) <= _SCAN_MAX_TAXON_IDS
+            and "" not in taxon_ids
+            and descriptor.is_unquoted_utf8
+        ):
+            return self._scan_rows_by_leading_id(descriptor, taxon_ids)
+        if descriptor.is_unquoted_utf8:
+            # Compare raw IDs, and decode only the rows that match
+            raw_ids = {taxon_id.encode() for taxon_id in taxon_ids}
+            raw_rows = self._iter_raw_rows(descriptor)
+            return (
+                [value.decode() for value in raw]
+                for raw in raw_rows
+                if raw[coreid_index] in raw_ids
+            )
+        rows = self._iter_rows(descriptor)
+        return (row for row in rows if row[coreid_index] in taxon_ids)
+
+    def _scan_rows_by_leading_id(
+        self, descriptor: FileDescriptor, taxon_ids: Collection[str]
+    ) -> Iterator[list[str]]:
+        """Find the rows starting with the given IDs by scanning raw bytes.
+
+        The file is memory-mapped and searched for each ID at the start of a
+        line, so only matching rows are ever decoded. Rows are yielded in
+        file order, as _iter_rows would.
+        """
+        file_path = self.path / descriptor.location
+        if not file_path.exists() or file_path.stat().st_size == 0:
+            return
+
+        delimiter = descriptor.fields_terminated_by
+        row_ends = (ord(delimiter), ord("\r"), ord("\n"))
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            data_start = 0
+            for _ in range(descriptor.ignore_header_lines):
+                newline = mm.find(b"\n", data_start)
+                if newline == -1:
+                    return
+                data_start = newline + 1
+
+            # Each distinct ID once, so a repeated ID yields its rows once
+            starts = []
+            for taxon_id in set(taxon_ids):
+                needle = taxon_id.encode("utf-8")
+                pos = data_start
+                while (i := mm.find(needle, pos)) != -1:
+                    end = i + len(needle)
+                    at_line_start = i == data_start or mm[i - 1] == ord("\n")
+                    if at_line_start and (end == size or mm[end] in row_ends):
+                        starts.append(i)
+                    pos = end
+
+            for start in sorted(starts):
+                end = mm.find(b"\n", start)
+                if end == -1:
+                    end = size
+                yield mm[start:end].decode(descriptor.encoding).rstrip("\r").split(delimiter)
+
+    def _build_row_parser(
+        self,
+        descriptor: FileDescriptor,
+        record_cls: type,
+        field_map: dict[str, str],
+        *,
+        id_attr: str = "taxon_id",
+        flag_fields: tuple[str, ...] = (),
+    ) -> Callable[[list[str]], object]:
+        """Generate a specialized row parser for a file's schema.
+
+        The column of every field is resolved up front and baked into
+        straight-line source, so parsing a row is a single constructor call
+        with plain indexing and no per-field lookups. Values of fields in
+        _INTERNED_FIELDS are interned.
+
+        Args:
+            descriptor: The file descriptor providing column indices.
+            record_cls: The dataclass to construct for each row.
+            field_map: Mapping of record attribute to DwC term name.
+            id_attr: Attribute set from the id (core) or coreid column.
+            flag_fields: Attributes to parse as booleans ("true"/"yes"/"1").
+
+        Returns:
+            A function taking a row and returning a record_cls instance.
+        """
+        key_index = descriptor.id_index if descriptor.is_core else descriptor.coreid_index
+        key_expr = f"row[{key_index}]" if key_index is not None else "''"
+        args = [f"{id_attr}={key_expr}"]
+
+        # Only integer indices and our own attribute names go into the
+        # source; term names from meta.xml are never interpolated
+        for attr, term in field_map.items():
+            index = descriptor.name_to_index.get(term)
+            if index is None:
+                expr = "''"
+            else:
+                expr = f"(row[{index}] if {index} < n else '')"
+            if attr in flag_fields:
+                expr = f"{expr}.lower() in _TRUE_VALUES"
+            elif attr in _INTERNED_FIELDS and index is not None:
+                expr = f"_intern{expr}"
+            args.append(f"{attr}={expr}")
+
+        source = (
+            "def parse(row):\n"
+            "    n = len(row)\n"
+            f"    return cls({', '.join(args)})\n"
+        )
+        namespace = {"cls": record_cls, "_TRUE_VALUES": _TRUE_VALUES, "_intern": sys.intern}
+        exec(source, namespace)
+        return namespace["parse"]
+
+    def _get_row_parser(
+        self,
+        descriptor: FileDescriptor,
+        record_cls: type,
+        field_map: dict[str, str],
+        *,
+        id_attr: str = "taxon_id",
+        flag_fields: tuple[str, ...] = (),
+    ) -> Callable[[list[str]], object]:
+        """Get the cached row parser for a file, building it on first use."""
+        parser = self._row_parsers.get(descriptor.row_type)
+        if parser is None:
+            parser = self._build_row_parser(
+                descriptor, record_cls, field_map, id_attr=id_attr, flag_fields=flag_fields
+            )
+            self._row_parsers[descriptor.row_type] = parser
+        return parser
 
     @property
     def core_descriptor(self) -> FileDescriptor | None:
@@ -288,40 +615,17 @@ class DarwinCoreArchive:
         if self._core is None:
             return
 
-        for row in self._iter_rows(self._core):
-            # Get field values by name
-            gv = lambda name: self._get_field_value(row, self._core.fields, name)
-
-            # Get the ID from the id index
-            taxon_id = row[self._core.id_index] if self._core.id_index is not None else ""
-
-            yield Taxon(
-                id=taxon_id,
-                references=gv("references"),
-                modified=gv("modified"),
-                scientific_name=gv("scientificName"),
-                scientific_name_authorship=gv("scientificNameAuthorship"),
-                rank=gv("taxonRank"),
-                verbatim_rank=gv("verbatimTaxonRank"),
-                kingdom=gv("kingdom"),
-                phylum=gv("phylum"),
-                class_=gv("class"),
-                order=gv("order"),
-                family=gv("family"),
-                genus=gv("genus"),
-                subgenus=gv("subgenus"),
-                taxon_remarks=gv("taxonRemarks"),
-                trend=gv("trend"),
-                fossil_range=gv("fossilRange"),
-                taxobox=gv("taxobox"),
-                accepted_name_usage=gv("acceptedNameUsage"),
-                accepted_name_usage_id=gv("acceptedNameUsageID"),
-                taxonomic_status=gv("taxonomicStatus"),
-            )
+        parser = self._get_row_parser(self._core, Taxon, _TAXON_FIELDS, id_attr="id")
+        yield from map(parser, self._iter_rows(self._core))
 
-    def iter_vernacular_names(self) -> Iterator[VernacularName]:
+    def iter_vernacular_names(
+        self, taxon_ids: Collection[str] | None = None
+    ) -> Iterator[VernacularName]:
         """Iterate over all vernacular names in the archive.
 
+        Args:
+            taxon_ids: If given, only yield records for these taxon IDs.
+
         Yields:
             VernacularName objects for each record.
         """
@@ -330,23 +634,19 @@ class DarwinCoreArchive:
             return
 
         desc = self._extensions[row_type]
-        for row in self._iter_rows(desc):
-            gv = lambda name: self._get_field_value(row, desc.fields, name)
-            taxon_id = row[desc.coreid_index] if desc.coreid_index is not None else ""
-
-            is_preferred_str = gv("isPreferredName").lower()
-            is_preferred = is_preferred_str in ("true", "yes", "1")
-
-            yield VernacularName(
-                taxon_id=taxon_id,
-                is_preferred=is_preferred,
-                language=gv("language"),
-                name=gv("vernacularName"),
-            )
+        parser = self._get_row_parser(
+            desc, VernacularName, _VERNACULAR_NAME_FIELDS, flag_fields=("is_preferred",)
+        )
+        yield from map(parser, self._iter_rows_for_taxa(desc, taxon_ids))
 
-    def iter_species_profiles(self) -> Iterator[SpeciesProfile]:
+    def iter_species_profiles(
+        self, taxon_ids: Collection[str] | None = None
+    ) -> Iterator[SpeciesProfile]:
         """Iterate over all species profiles in the archive.
 
+        Args:
+            taxon_ids: If given, only yield records for these taxon IDs.
+
         Yields:
             SpeciesProfile objects for each record.
         """
@@ -355,22 +655,19 @@ class DarwinCoreArchive:
             return
 
         desc = self._extensions[row_type]
-        for row in self._iter_rows(desc):
-            gv = lambda name: self._get_field_value(row, desc.fields, name)
-            taxon_id = row[desc.coreid_index] if desc.coreid_index is not None else ""
-
-            is_extinct_str = gv("isExtinct").lower()
-            is_extinct = is_extinct_str in ("true", "yes", "1")
-
-            yield SpeciesProfile(
-                taxon_id=taxon_id,
-                is_extinct=is_extinct,
-                living_period=gv("livingPeriod"),
-            )
+        parser = self._get_row_parser(
+            desc, SpeciesProfile, _SPECIES_PROFILE_FIELDS, flag_fields=("is_extinct",)
+        )
+        yield from map(parser, self._iter_rows_for_taxa(desc, taxon_ids))
 
-    def iter_multimedia(self) -> Iterator[Multimedia]:
+    def iter_multimedia(
+        self, taxon_ids: Collection[str] | None = None
+    ) -> Iterator[Multimedia]:
         """Iterate over all multimedia records in the archive.
 
+        Args:
+            taxon_ids: If given, only yield records for these taxon IDs.
+
         Yields:
             Multimedia objects for each record.
         """
@@ -379,27 +676,17 @@ class DarwinCoreArchive:
             return
 
         desc = self._extensions[row_type]
-        for row in self._iter_rows(desc):
-            gv = lambda name: self._get_field_value(row, desc.fields, name)
-            taxon_id = row[desc.coreid_index] if desc.coreid_index is not None else ""
-
-            yield Multimedia(
-                taxon_id=taxon_id,
-                title=gv("title"),
-                created=gv("created"),
-                type=gv("type"),
-                identifier=gv("identifier"),
-                creator=gv("creator"),
-                references=gv("references"),
-                description=gv("description"),
-                publisher=gv("publisher"),
-                license=gv("license"),
-                source=gv("source"),
-            )
+        parser = self._get_row_parser(desc, Multimedia, _MULTIMEDIA_FIELDS)
+        yield from map(parser, self._iter_rows_for_taxa(desc, taxon_ids))
 
-    def iter_descriptions(self) -> Iterator[Description]:
+    def iter_descriptions(
+        self, taxon_ids: Collection[str] | None = None
+    ) -> Iterator[Description]:
         """Iterate over all description records in the archive.
 
+        Args:
+            taxon_ids: If given, only yield records for these taxon IDs.
+
         Yields:
             Description objects for each record.
         """
@@ -408,22 +695,17 @@ class DarwinCoreArchive:
             return
 
         desc = self._extensions[row_type]
-        for row in self._iter_rows(desc):
-            gv = lambda name: self._get_field_value(row, desc.fields, name)
-            taxon_id = row[desc.coreid_index] if desc.coreid_index is not None else ""
-
-            yield Description(
-                taxon_id=taxon_id,
-                language=gv("language"),
-                type=gv("type"),
-                description=gv("description"),
-                references=gv("references"),
-                license=gv("license"),
-            )
+        parser = self._get_row_parser(desc, Description, _DESCRIPTION_FIELDS)
+        yield from map(parser, self._iter_rows_for_taxa(desc, taxon_ids))
 
-    def iter_type_specimens(self) -> Iterator[TypeSpecimen]:
+    def iter_type_specimens(
+        self, taxon_ids: Collection[str] | None = None
+    ) -> Iterator[TypeSpecimen]:
         """Iterate over all type specimen records in the archive.
 
+        Args:
+            taxon_ids: If given, only yield records for these taxon IDs.
+
         Yields:
             TypeSpecimen objects for each record.
         """
@@ -432,28 +714,137 @@ class DarwinCoreArchive:
             return
 
         desc = self._extensions[row_type]
-        for row in self._iter_rows(desc):
-            gv = lambda name: self._get_field_value(row, desc.fields, name)
-            taxon_id = row[desc.coreid_index] if desc.coreid_index is not None else ""
+        parser = self._get_row_parser(desc, TypeSpecimen, _TYPE_SPECIMEN_FIELDS)
+        yield from map(parser, self._iter_rows_for_taxa(desc, taxon_ids))
 
-            yield TypeSpecimen(
-                taxon_id=taxon_id,
-                scientific_name=gv("scientificName"),
-                type_status=gv("typeStatus"),
-            )
+    def _read_arrow_table(self, descriptor: FileDescriptor) -> pa.Table:
+        """Read a whole data file into a pyarrow Table.
+
+        Columns are named after the DwC terms ("id"/"coreid" for the key
+        column, "columnN" for undeclared ones) and read as strings.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.csv as pa_csv
+        except ImportError as e:
+            raise ImportError(
+                "Bulk loading requires pyarrow. Install it with: pip install 'taxonomica[arrow]'"
+            ) from e
+
+        key_index = descriptor.id_index if descriptor.is_core else descriptor.coreid_index
+        indices = [fd.index for fd in descriptor.fields]
+        if key_index is not None:
+            indices.append(key_index)
+        num_columns = max(indices, default=-1) + 1
+
+        names = [f"column{i}" for i in range(num_columns)]
+        if key_index is not None:
+            names[key_index] = "id" if descriptor.is_core else "coreid"
+        taken = set(names)
+        for name, index in descriptor.name_to_index.items():
+            if name not in taken:
+                names[index] = name
+                taken.add(name)
+
+        table = pa_csv.read_csv(
+            self.path / descriptor.location,
+            read_options=pa_csv.ReadOptions(
+                column_names=names,
+                skip_rows=descriptor.ignore_header_lines,
+                encoding=descriptor.encoding,
+            ),
+            parse_options=pa_csv.ParseOptions(
+                delimiter=descriptor.fields_terminated_by,
+                quote_char=descriptor.fields_enclosed_by or False,
+            ),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in names},
+                strings_can_be_null=False,
+            ),
+        )
+        return table
+
+    def load_taxa_arrow(self) -> pa.Table:
+        """Load the whole core taxon file as a pyarrow Table.
+
+        Much faster than iter_taxa() for bulk consumers that want every
+        row, since parsing happens in pyarrow's multithreaded C++ reader.
+        Use iter_taxa() to stream records instead. Requires pyarrow
+        (the ``arrow`` extra).
+
+        Returns:
+            Table with one string column per DwC term.
+
+        Raises:
+            ValueError: If the archive has no core file.
+        """
+        if self._core is None:
+            raise ValueError(f"No core file defined in {self.path / 'meta.xml'}")
+        return self._read_arrow_table(self._core)
+
+    def load_vernacular_names_arrow(self) -> pa.Table | None:
+        """Load the whole vernacular name extension as a pyarrow Table.
+
+        Requires pyarrow (the ``arrow`` extra).
+
+        Returns:
+            Table with one string column per DwC term, or None if the
+            archive has no vernacular name extension.
+        """
+        row_type = "http://rs.gbif.org/terms/1.0/VernacularName"
+        if row_type not in self._extensions:
+            return None
+        return self._read_arrow_table(self._extensions[row_type])
 
     def get_vernacular_names_by_taxon(self) -> dict[str, list[VernacularName]]:
         """Build a mapping from taxon ID to vernacular names.
 
+        Use get_vernacular_name_strings_by_taxon() when only the names
+        themselves are needed.
+
         Returns:
             Dictionary mapping taxon IDs to lists of vernacular names.
         """
-        result: dict[str, list[VernacularName]] = {}
-        for vn in self.iter_vernacular_names():
-            if vn.taxon_id not in result:
-                result[vn.taxon_id] = []
-            result[vn.taxon_id].append(vn)
-        return result
+        row_type = "http://rs.gbif.org/terms/1.0/VernacularName"
+        if row_type not in self._extensions:
+            return {}
+
+        desc = self._extensions[row_type]
+        parser = self._get_row_parser(
+            desc, VernacularName, _VERNACULAR_NAME_FIELDS, flag_fields=("is_preferred",)
+        )
+        coreid_index = desc.coreid_index
+        result: defaultdict[str, list[VernacularName]] = defaultdict(list)
+        for row in self._iter_rows(desc):
+            taxon_id = row[coreid_index] if coreid_index is not None else ""
+            result[taxon_id].append(parser(row))
+        return dict(result)
+
+    def get_vernacular_name_strings_by_taxon(self) -> dict[str, list[str]]:
+        """Build a mapping from taxon ID to vernacular name strings.
+
+        Reads the name column straight from the raw rows, without building
+        VernacularName objects.
+
+        Returns:
+            Dictionary mapping taxon IDs to lists of names, in file order.
+        """
+        row_type = "http://rs.gbif.org/terms/1.0/VernacularName"
+        if row_type not in self._extensions:
+            return {}
+
+        desc = self._extensions[row_type]
+        coreid_index = desc.coreid_index
+        name_index = desc.name_to_index.get("vernacularName")
+        result: defaultdict[str, list[str]] = defaultdict(list)
+        for row in self._iter_rows(desc):
+            taxon_id = row[coreid_index] if coreid_index is not None else ""
+            name = row[name_index] if name_index is not None and name_index < len(row) else ""
+            result[taxon_id].append(name)
+        return dict(result)
 
     def get_species_profiles_by_taxon(self) -> dict[str, SpeciesProfile]:
         """Build a mapping from taxon ID to species profile.
@@ -463,19 +854,109 @@ class DarwinCoreArchive:
         """
         return {sp.taxon_id: sp for sp in self.iter_species_profiles()}
 
+    def summary(self) -> tuple[int, dict[str, int]]:
+        """Count taxa and their rank distribution in a single pass.
+
+        Reads the rank column straight from the raw rows, without building
+        Taxon objects.
+
+        Returns:
+            Tuple of (total taxa, dictionary mapping rank names to counts).
+        """
+        count = 0
+        distribution: Counter[str] = Counter()
+        if self._core is None:
+            return count, {}
+
+        rank_index = self._core.name_to_index.get("taxonRank")
+        if self._core.is_unquoted_utf8:
+            # Count the undecoded rank values; only the distinct ones are decoded
+            raw_distribution: Counter[bytes] = Counter()
+            for raw in self._iter_raw_rows(self._core):
+                count += 1
+                has_rank = rank_index is not None and rank_index < len(raw)
+                raw_distribution[raw[rank_index] if has_rank else b""] += 1
+            for raw_rank, n in raw_distribution.items():
+                distribution[raw_rank.decode() or "unknown"] += n
+            return count, dict(distribution)
+
+        for row in self._iter_rows(self._core):
+            count += 1
+            rank = row[rank_index] if rank_index is not None and rank_index < len(row) else ""
+            distribution[rank or "unknown"] += 1
+        return count, dict(distribution)
+
+    def _byte_ranges(self, descriptor: FileDescriptor, n: int) -> list[tuple[int, int]]:
+        """Split a data file into up to n byte ranges aligned to row starts.
+
+        Header lines are excluded. Each boundary is moved forward to just
+        past the next newline, so no row is split between ranges.
+        """
+        file_path = self.path / descriptor.location
+        with open(file_path, "rb") as f:
+            for _ in range(descriptor.ignore_header_lines):
+                f.readline()
+            data_start = f.tell()
+            size = os.fstat(f.fileno()).st_size
+
+            boundaries = [data_start]
+            for i in range(1, n):
+                f.seek(max(data_start + (size - data_start) * i // n, boundaries[-1]))
+                f.readline()
+                boundaries.append(min(f.tell(), size))
+            boundaries.append(size)
+
+        return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if a < b]
+
+    def get_rank_distribution_parallel(self, workers: int | None = None) -> dict[str, int]:
+        """Get the distribution of taxonomic ranks using worker processes.
+
+        The core file is split into newline-aligned byte ranges that are
+        counted in parallel and merged. This only pays off for very large
+        archives; files that cannot be split by newline (quoted or non-UTF-8)
+        fall back to get_rank_distribution().
+
+        Args:
+            workers: Number of worker processes (default: CPU count).
+
+        Returns:
+            Dictionary mapping rank names to counts.
+        """
+        core = self._core
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if core is None or workers <= 1 or not core.is_unquoted_utf8:
+            return self.get_rank_distribution()
+
+        file_path = self.path / core.location
+        if not file_path.exists():
+            return {}
+
+        ranges = self._byte_ranges(core, workers)
+        rank_index = core.name_to_index.get("taxonRank")
+        distribution: Counter[str] = Counter()
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges) or 1)) as executor:
+            futures = [
+                executor.submit(
+                    _count_ranks_in_range,
+                    file_path, start, end, core.fields_terminated_by, rank_index,
+                )
+                for start, end in ranges
+            ]
+            for future in futures:
+                distribution.update(future.result())
+        return dict(distribution)
+
     def count_taxa(self) -> int:
         """Count the total number of taxa in the archive."""
-        return sum(1 for _ in self.iter_taxa())
+        return self.summary()[0]
 
     def get_rank_distribution(self) -> dict[str, int]:
         """Get the distribution of taxonomic ranks.
 
+        Use summary() to get this together with the total count.
+
         Returns:
             Dictionary mapping rank names to counts.
         """
-        distribution: dict[str, int] = {}
-        for taxon in self.iter_taxa():
-            rank = taxon.rank or "unknown"
-            distribution[rank] = distribution.get(rank, 0) + 1
-        return distribution
-
+        return self.summary()[1]
@@ -13,19 +13,152 @@ Reference: https://www.gbif.org/dataset/d7dddbf4-2cf0-4f39-9b2a-bb099caae36c
 from __future__ import annotations
 
 import csv
+import io
+import mmap
+import os
 import sys
-from dataclasses import dataclass, field
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from operator import itemgetter
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Callable, Collection, Iterable, Iterator, Sequence
 
 # Increase CSV field size limit for large fields in GBIF data
 csv.field_size_limit(sys.maxsize)
 
 
-@dataclass
+def _read_header(path: Path) -> list[str]:
+    """Read the column names from the header line of a TSV file."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return next(csv.reader(f, delimiter="\t"), [])
+
+
+def _column_indices(header: list[str], names: Iterable[str]) -> list[int]:
+    """Resolve column names to positions in rows from _iter_tsv_rows().
+
+    Names missing from the header resolve to the empty slot that
+    _iter_tsv_rows() appends to every row.
+    """
+    columns = {name: i for i, name in enumerate(header)}
+    return [columns.get(name, len(header)) for name in names]
+
+
+def _iter_tsv_rows(reader: Iterator[list[str]], width: int) -> Iterator[list[str]]:
+    """Normalize csv.reader rows to the header width plus one empty slot.
+
+    Blank lines are skipped and short rows are padded, so every column
+    index from _column_indices() is valid without per-field checks.
+    """
+    for row in reader:
+        if len(row) != width:
+            if not row:
+                continue
+            row = row[:width] + [""] * (width - len(row))
+        row.append("")
+        yield row
+
+
+def _select_rows(
+    reader: Iterator[list[str]],
+    width: int,
+    indices: list[int],
+    status_index: int | None = None,
+) -> Iterator[tuple[str, ...]]:
+    """Yield the values at the given row positions as a tuple per row.
+
+    Rows are normalized by _iter_tsv_rows(). If status_index is given,
+    only rows whose value there is "accepted" are included.
+    """
+    rows = _iter_tsv_rows(reader, width)
+    if status_index is not None:
+        rows = (row for row in rows if row[status_index] == "accepted")
+    if len(indices) == 1:
+        (index,) = indices
+        return ((row[index],) for row in rows)
+    return map(itemgetter(*indices), rows)
+
+
+def _line_aligned_ranges(path: Path, n: int) -> list[tuple[int, int]]:
+    """Split a TSV file into up to n byte ranges aligned to row starts.
+
+    The header line is excluded. Each boundary is moved forward to just
+    past the next newline, so no line is split between ranges.
+    """
+    with open(path, "rb") as f:
+        f.readline()  # Header
+        data_start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+
+        boundaries = [data_start]
+        for i in range(1, n):
+            f.seek(max(data_start + (size - data_start) * i // n, boundaries[-1]))
+            f.readline()
+            boundaries.append(min(f.tell(), size))
+        boundaries.append(size)
+
+    return [(a, b) for a, b in zip(boundaries, boundaries[1:]) if a < b]
+
+
+def _contains_quote(path: Path) -> bool:
+    """Check whether a file contains a double quote anywhere."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b'"') != -1
+
+
+def _read_rows_in_range(
+    file_path: Path,
+    start: int,
+    end: int,
+    width: int,
+    indices: list[int],
+    status_index: int | None,
+) -> list[tuple[str, ...]]:
+    """Read selected columns of the rows in a newline-aligned byte range.
+
+    Runs in a worker process for GBIFBackbone.iter_taxon_rows_parallel().
+    """
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start).decode("utf-8")
+
+    reader = csv.reader(io.StringIO(data, newline=""), delimiter="\t")
+    return list(_select_rows(reader, width, indices, status_index))
+
+
+def _row_values(
+    header: list[str],
+    columns: tuple[str, ...],
+    interned: Collection[str] = (),
+) -> Callable[[list[str]], tuple]:
+    """Build a function extracting the given columns from a row, in order.
+
+    The result feeds a record's positional constructor directly, e.g.
+    GBIFTaxon(*values(row)). Expects at least two columns. Values of the
+    columns named in ``interned`` are interned with sys.intern().
+    """
+    indices = _column_indices(header, columns)
+    if not any(name in interned for name in columns):
+        return itemgetter(*indices)
+
+    # Generate straight-line source, as dwca does for its row parsers, so
+    # interning adds no per-row loop
+    items = ", ".join(
+        f"_intern(row[{i}])" if name in interned else f"row[{i}]"
+        for i, name in zip(indices, columns)
+    )
+    namespace = {"_intern": sys.intern}
+    exec(f"def values(row):\n    return ({items},)\n", namespace)
+    return namespace["values"]
+
+
+@dataclass(slots=True)
 class GBIFTaxon:
     """A taxonomic record from the GBIF Backbone.
 
@@ -53,6 +186,19 @@ class GBIFTaxon:
     family: str = ""
     genus: str = ""
 
+    # Taxon.tsv column for each field, in field order (see _row_values)
+    _COLUMNS: ClassVar[tuple[str, ...]] = (
+        "taxonID", "parentNameUsageID", "acceptedNameUsageID", "scientificName",
+        "canonicalName", "scientificNameAuthorship", "genericName", "specificEpithet",
+        "infraspecificEpithet", "taxonRank", "taxonomicStatus", "nomenclaturalStatus",
+        "kingdom", "phylum", "class", "order", "family", "genus",
+    )
+    # Low-cardinality columns, interned so records share one string per value
+    _INTERNED_COLUMNS: ClassVar[frozenset[str]] = frozenset({
+        "taxonRank", "taxonomicStatus", "nomenclaturalStatus",
+        "kingdom", "phylum", "class", "order", "family", "genus",
+    })
+
     @property
     def is_accepted(self) -> bool:
         """Check if this is an accepted taxon (not a synonym)."""
@@ -69,7 +215,7 @@ class GBIFTaxon:
         return self.canonical_name or self.scientific_name
 
 
-@dataclass
+@dataclass(slots=True)
 class GBIFVernacularName:
     """A vernacular (common) name for a taxon."""
 
@@ -80,8 +226,16 @@ class GBIFVernacularName:
     country_code: str = ""
     source: str = ""
 
+    # VernacularName.tsv column for each field, in field order
+    _COLUMNS: ClassVar[tuple[str, ...]] = (
+        "taxonID", "vernacularName", "language", "country", "countryCode", "source",
+    )
+    _INTERNED_COLUMNS: ClassVar[frozenset[str]] = frozenset({
+        "language", "country", "countryCode", "source",
+    })
+
 
-@dataclass
+@dataclass(slots=True)
 class GBIFMultimedia:
     """Multimedia record for a taxon."""
 
@@ -94,6 +248,13 @@ class GBIFMultimedia:
     creator: str = ""
     source: str = ""
 
+    # Multimedia.tsv column for each field, in field order
+    _COLUMNS: ClassVar[tuple[str, ...]] = (
+        "taxonID", "identifier", "references", "title",
+        "description", "license", "creator", "source",
+    )
+    _INTERNED_COLUMNS: ClassVar[frozenset[str]] = frozenset({"license", "source"})
+
 
 class GBIFBackbone:
     """Parser for the GBIF Backbone Taxonomy Darwin Core Archive.
@@ -121,44 +282,188 @@ class GBIFBackbone:
         if not self.taxon_file.exists():
             raise FileNotFoundError(f"Taxon.tsv not found in {self.path}")
 
-    def iter_taxa(self, *, accepted_only: bool = False) -> Iterator[GBIFTaxon]:
+        # Column layout of Taxon.tsv, read once
+        self._taxon_header = _read_header(self.taxon_file)
+
+        # Taxon ID -> byte offset of its row, and the GBIFTaxon field
+        # extractor for a row, both built by get_taxon_by_id()
+        self._taxon_offsets: dict[str, int] | None = None
+        self._taxon_values: Callable[[list[str]], tuple] | None = None
+
+    def iter_taxa(
+        self, *, accepted_only: bool = False, use_arrow: bool = False
+    ) -> Iterator[GBIFTaxon]:
         """Iterate over all taxa in the backbone.
 
         Args:
             accepted_only: If True, only yield accepted taxa (skip synonyms).
+            use_arrow: If True, parse with pyarrow (see iter_taxon_batches()).
 
         Yields:
             GBIFTaxon objects for each record.
         """
+        if use_arrow:
+            interned = [name in GBIFTaxon._INTERNED_COLUMNS for name in GBIFTaxon._COLUMNS]
+            batches = self.iter_taxon_batches(GBIFTaxon._COLUMNS, accepted_only=accepted_only)
+            for columns in batches:
+                columns = [
+                    list(map(sys.intern, column)) if intern else column
+                    for column, intern in zip(columns, interned)
+                ]
+                yield from map(GBIFTaxon, *columns)
+            return
+
+        header = self._taxon_header
+        values = _row_values(header, GBIFTaxon._COLUMNS, GBIFTaxon._INTERNED_COLUMNS)
+        (status_i,) = _column_indices(header, ("taxonomicStatus",))
+
         with open(self.taxon_file, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-
-            for row in reader:
-                taxon = GBIFTaxon(
-                    id=row.get("taxonID", ""),
-                    parent_id=row.get("parentNameUsageID", ""),
-                    accepted_id=row.get("acceptedNameUsageID", ""),
-                    scientific_name=row.get("scientificName", ""),
-                    canonical_name=row.get("canonicalName", ""),
-                    authorship=row.get("scientificNameAuthorship", ""),
-                    generic_name=row.get("genericName", ""),
-                    specific_epithet=row.get("specificEpithet", ""),
-                    infraspecific_epithet=row.get("infraspecificEpithet", ""),
-                    rank=row.get("taxonRank", ""),
-                    taxonomic_status=row.get("taxonomicStatus", ""),
-                    nomenclatural_status=row.get("nomenclaturalStatus", ""),
-                    kingdom=row.get("kingdom", ""),
-                    phylum=row.get("phylum", ""),
-                    class_=row.get("class", ""),
-                    order=row.get("order", ""),
-                    family=row.get("family", ""),
-                    genus=row.get("genus", ""),
-                )
+            reader = csv.reader(f, delimiter="\t")
+            next(reader, None)  # Header
 
-                if accepted_only and not taxon.is_accepted:
+            for row in _iter_tsv_rows(reader, len(header)):
+                # Filter on the raw status before building the record
+                if accepted_only and row[status_i] != "accepted":
                     continue
 
-                yield taxon
+                yield GBIFTaxon(*values(row))
+
+    def iter_taxon_rows(
+        self, columns: Sequence[str], *, accepted_only: bool = False
+    ) -> Iterator[tuple[str, ...]]:
+        """Stream selected Taxon.tsv columns row by row.
+
+        Reads the file like iter_taxa() but yields only the requested
+        fields as a tuple, without building a GBIFTaxon per row.
+
+        Args:
+            columns: Taxon.tsv column names to read (missing ones read as "").
+            accepted_only: If True, only include accepted taxa.
+
+        Yields:
+            One tuple of values per row, in the order of ``columns``.
+        """
+        header = self._taxon_header
+        indices = _column_indices(header, columns)
+        (status_i,) = _column_indices(header, ("taxonomicStatus",))
+
+        with open(self.taxon_file, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f, delimiter="\t")
+            next(reader, None)  # Header
+
+            yield from _select_rows(
+                reader, len(header), indices, status_i if accepted_only else None
+            )
+
+    def iter_taxon_rows_parallel(
+        self,
+        columns: Sequence[str],
+        *,
+        accepted_only: bool = False,
+        workers: int | None = None,
+    ) -> Iterator[tuple[str, ...]]:
+        """Stream selected Taxon.tsv columns, parsing in worker processes.
+
+        Yields the same rows, in the same order, as iter_taxon_rows(). The
+        file is split into newline-aligned byte ranges that are parsed in
+        parallel. Each range's rows are returned to this process as a list,
+        so this trades memory and pickling for parse time and only pays off
+        for very large files on several cores. Files containing a double
+        quote (where a quoted field could span lines) are read serially.
+
+        Args:
+            columns: Taxon.tsv column names to read (missing ones read as "").
+            accepted_only: If True, only include accepted taxa.
+            workers: Number of worker processes (default: CPU count).
+
+        Yields:
+            One tuple of values per row, in the order of ``columns``.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers <= 1 or _contains_quote(self.taxon_file):
+            yield from self.iter_taxon_rows(columns, accepted_only=accepted_only)
+            return
+
+        header = self._taxon_header
+        indices = _column_indices(header, columns)
+        (status_i,) = _column_indices(header, ("taxonomicStatus",))
+        ranges = _line_aligned_ranges(self.taxon_file, workers)
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(ranges) or 1)) as executor:
+            futures = [
+                executor.submit(
+                    _read_rows_in_range,
+                    self.taxon_file, start, end, len(header), indices,
+                    status_i if accepted_only else None,
+                )
+                for start, end in ranges
+            ]
+            for future in futures:
+                yield from future.result()
+
+    def iter_taxon_batches(
+        self,
+        columns: Sequence[str],
+        *,
+        accepted_only: bool = False,
+        block_size: int = 64 << 20,
+    ) -> Iterator[list[list[str]]]:
+        """Stream selected Taxon.tsv columns in batches using pyarrow.
+
+        Parsing and status filtering run in pyarrow's C++ CSV reader, and
+        only the requested columns are converted to Python strings. Callers
+        that need a few columns can skip building GBIFTaxon objects entirely.
+        Requires pyarrow (the ``arrow`` extra).
+
+        Args:
+            columns: Taxon.tsv column names to read (missing ones read as "").
+            accepted_only: If True, only include accepted taxa.
+            block_size: Number of bytes parsed per batch.
+
+        Yields:
+            One list of values per requested column, all covering the same rows.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+            import pyarrow.csv as pa_csv
+        except ImportError as e:
+            raise ImportError(
+                "Arrow parsing requires pyarrow. Install it with: pip install 'taxonomica[arrow]'"
+            ) from e
+
+        header = self._taxon_header
+        if accepted_only and "taxonomicStatus" not in header:
+            return
+
+        include = [name for name in dict.fromkeys(columns) if name in header]
+        if accepted_only and "taxonomicStatus" not in include:
+            include.append("taxonomicStatus")
+
+        reader = pa_csv.open_csv(
+            self.taxon_file,
+            read_options=pa_csv.ReadOptions(block_size=block_size),
+            parse_options=pa_csv.ParseOptions(delimiter="\t"),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=include,
+                column_types={name: pa.string() for name in include},
+                strings_can_be_null=False,
+            ),
+        )
+        for batch in reader:
+            if accepted_only:
+                batch = batch.filter(pc.equal(batch.column("taxonomicStatus"), "accepted"))
+            num_rows = batch.num_rows
+            if not num_rows:
+                continue
+            yield [
+                batch.column(name).to_pylist() if name in header else [""] * num_rows
+                for name in columns
+            ]
 
     def iter_vernacular_names(self) -> Iterator[GBIFVernacularName]:
         """Iterate over all vernacular names.
@@ -171,17 +476,37 @@ class GBIFBackbone:
             return
 
         with open(vn_file, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-
-            for row in reader:
-                yield GBIFVernacularName(
-                    taxon_id=row.get("taxonID", ""),
-                    name=row.get("vernacularName", ""),
-                    language=row.get("language", ""),
-                    country=row.get("country", ""),
-                    country_code=row.get("countryCode", ""),
-                    source=row.get("source", ""),
-                )
+            reader = csv.reader(f, delimiter="\t")
+            header = next(reader, [])
+            values = _row_values(
+                header, GBIFVernacularName._COLUMNS, GBIFVernacularName._INTERNED_COLUMNS
+            )
+
+            for row in _iter_tsv_rows(reader, len(header)):
+                yield GBIFVernacularName(*values(row))
+
+    def iter_vernacular_rows(self, columns: Sequence[str]) -> Iterator[tuple[str, ...]]:
+        """Stream selected VernacularName.tsv columns row by row.
+
+        Like iter_taxon_rows(), this skips building a GBIFVernacularName
+        per row.
+
+        Args:
+            columns: VernacularName.tsv column names to read (missing ones
+                read as "").
+
+        Yields:
+            One tuple of values per row, in the order of ``columns``.
+        """
+        vn_file = self.path / "VernacularName.tsv"
+        if not vn_file.exists():
+            return
+
+        with open(vn_file, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f, delimiter="\t")
+            header = next(reader, [])
+
+            yield from _select_rows(reader, len(header), _column_indices(header, columns))
 
     def iter_multimedia(self) -> Iterator[GBIFMultimedia]:
         """Iterate over all multimedia records.
@@ -194,25 +519,54 @@ class GBIFBackbone:
             return
 
         with open(mm_file, encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f, delimiter="\t")
-
-            for row in reader:
-                yield GBIFMultimedia(
-                    taxon_id=row.get("taxonID", ""),
-                    identifier=row.get("identifier", ""),
-                    references=row.get("references", ""),
-                    title=row.get("title", ""),
-                    description=row.get("description", ""),
-                    license=row.get("license", ""),
-                    creator=row.get("creator", ""),
-                    source=row.get("source", ""),
-                )
+            reader = csv.reader(f, delimiter="\t")
+            header = next(reader, [])
+            values = _row_values(header, GBIFMultimedia._COLUMNS, GBIFMultimedia._INTERNED_COLUMNS)
+
+            for row in _iter_tsv_rows(reader, len(header)):
+                yield GBIFMultimedia(*values(row))
+
+    def _build_taxon_offsets(self) -> dict[str, int]:
+        """Map each taxon ID to the byte offset of its first row in Taxon.tsv.
+
+        Rows are split by csv.reader, as in iter_taxa(), so quoted fields
+        spanning several lines are handled; no records are built.
+        """
+        header = self._taxon_header
+        (id_i,) = _column_indices(header, ("taxonID",))
+        offsets: dict[str, int] = {}
+        line_end = 0
+
+        with open(self.taxon_file, "rb") as f:
+
+            def lines() -> Iterator[str]:
+                nonlocal line_end
+                for line in f:
+                    line_end += len(line)
+                    yield line.decode("utf-8")
+
+            # csv.reader pulls one line at a time, so the end of the last
+            # line it consumed is where the next row starts
+            reader = csv.reader(lines(), delimiter="\t")
+            next(reader, None)  # Header
+
+            while True:
+                row_start = line_end
+                row = next(reader, None)
+                if row is None:
+                    break
+                if row:
+                    taxon_id = row[id_i] if id_i < len(row) else ""
+                    if taxon_id not in offsets:
+                        offsets[taxon_id] = row_start
+
+        return offsets
 
     def get_taxon_by_id(self, taxon_id: str) -> GBIFTaxon | None:
         """Find a single taxon by ID.
 
-        Note: This scans the file sequentially. For repeated lookups,
-        consider building an index.
+        The first call indexes the byte offset of every row in one pass
+        over Taxon.tsv; each lookup then reads and parses a single row.
 
         Args:
             taxon_id: The taxon ID to find.
@@ -220,9 +574,23 @@ class GBIFBackbone:
         Returns:
             The matching taxon, or None if not found.
         """
-        for taxon in self.iter_taxa():
-            if taxon.id == taxon_id:
-                return taxon
+        if self._taxon_offsets is None:
+            self._taxon_offsets = self._build_taxon_offsets()
+            self._taxon_values = _row_values(
+                self._taxon_header, GBIFTaxon._COLUMNS, GBIFTaxon._INTERNED_COLUMNS
+            )
+
+        offset = self._taxon_offsets.get(taxon_id)
+        if offset is None:
+            return None
+
+        values = self._taxon_values
+        with open(self.taxon_file, "rb") as f:
+            f.seek(offset)
+            text = io.TextIOWrapper(f, encoding="utf-8", newline="")
+            reader = csv.reader(text, delimiter="\t")
+            for row in _iter_tsv_rows(reader, len(self._taxon_header)):
+                return GBIFTaxon(*values(row))
         return None
 
     def count_taxa(self, *, accepted_only: bool = False) -> int:
@@ -245,9 +613,12 @@ class GBIFBackbone:
         Returns:
             Dictionary mapping rank names to counts.
         """
-        distribution: dict[str, int] = {}
-        for taxon in self.iter_taxa(accepted_only=accepted_only):
-            rank = taxon.rank or "unknown"
-            distribution[rank] = distribution.get(rank, 0) + 1
-        return distribution
+        # Count the raw rank column; only the distinct ranks are then merged
+        raw_distribution = Counter(
+            rank for (rank,) in self.iter_taxon_rows(("taxonRank",), accepted_only=accepted_only)
+        )
+        distribution: Counter[str] = Counter()
+        for rank, n in raw_distribution.items():
+            distribution[rank or "unknown"] += n
+        return dict(distribution)
 
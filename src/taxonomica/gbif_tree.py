@@ -11,11 +11,17 @@ This is much more efficient than the Wikipedia parser because:
 
 from __future__ import annotations
 
+import gc
+import itertools
+import pickle
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator
 
 from taxonomica.gbif_backbone import GBIFBackbone, GBIFTaxon
 
@@ -57,8 +63,22 @@ MAJOR_RANKS = ["kingdom", "phylum", "class", "order", "family", "genus", "specie
 # Rank priority for sorting (lower number = higher in hierarchy)
 RANK_PRIORITY = {rank: i for i, rank in enumerate(RANK_ORDER)}
 
+# Version of the file layout written by GBIFTaxonomyTree.save()
+_SAVE_FORMAT_VERSION = 2
 
-@dataclass
+# One bit per rank in RANK_ORDER, for rank-set checks on a path
+_RANK_BITS = {rank: 1 << i for i, rank in enumerate(RANK_ORDER)}
+
+# Rank -> bitmask of the major ranks its path must contain to be complete.
+# Ranks missing from RANK_ORDER require every major rank.
+_REQUIRED_RANK_MASKS = {
+    rank: sum(_RANK_BITS[r] for r in MAJOR_RANKS if RANK_PRIORITY[r] < priority)
+    for rank, priority in RANK_PRIORITY.items()
+}
+_ALL_MAJOR_RANKS_MASK = sum(_RANK_BITS[r] for r in MAJOR_RANKS)
+
+
+@dataclass(slots=True)
 class TaxonomyNode:
     """A node in the taxonomy tree.
 
@@ -100,18 +120,44 @@ class TaxonomyNode:
 
     def iter_descendants(self) -> Iterator[TaxonomyNode]:
         """Iterate over all descendants in depth-first order."""
-        for child in self.children.values():
-            yield child
-            yield from child.iter_descendants()
+        # One iterator per open level, so each step costs the same
+        # regardless of depth (no nested generators)
+        stack = [iter(self.children.values())]
+        while stack:
+            for child in stack[-1]:
+                yield child
+                if child.children:
+                    stack.append(iter(child.children.values()))
+                    break
+            else:
+                stack.pop()
 
     def count_descendants(self) -> int:
         """Count all descendants of this node."""
-        return sum(1 for _ in self.iter_descendants())
+        count = 0
+        stack = [self]
+        while stack:
+            children = stack.pop().children
+            count += len(children)
+            stack.extend(children.values())
+        return count
 
     def get_rank_priority(self) -> int:
         """Get the rank priority (lower = higher in taxonomy hierarchy)."""
         return RANK_PRIORITY.get(self.rank, 999)
 
+    def _required_rank_mask(self) -> int:
+        """Get the rank bits a complete path through this node must contain."""
+        if self.rank == "root":
+            return 0
+
+        # Kingdoms at root are complete (they are the top of their tree)
+        if self.rank == "kingdom" and self.parent and self.parent.rank == "root":
+            return 0
+
+        # All major ranks above this node's rank must be on the path
+        return _REQUIRED_RANK_MASKS.get(self.rank, _ALL_MAJOR_RANKS_MASK)
+
     def has_complete_path(self) -> bool:
         """Check if this node has a complete taxonomic path.
 
@@ -121,35 +167,17 @@ class TaxonomyNode:
 
         Kingdoms at the root level are always considered complete.
         """
-        if self.rank == "root":
-            return True
-
-        # Kingdoms at root are complete (they are the top of their tree)
-        if self.rank == "kingdom" and self.parent and self.parent.rank == "root":
-            return True
-
-        # Get ranks present in the path (excluding root)
-        path_ranks = set()
-        for node in self.get_path_to_root():
-            if node.rank and node.rank != "root":
-                path_ranks.add(node.rank)
-
-        # For major ranks, all ranks above should be present
-        if self.rank in MAJOR_RANKS:
-            my_idx = MAJOR_RANKS.index(self.rank)
-            required_major_ranks = MAJOR_RANKS[:my_idx]
-        else:
-            # For non-major ranks, check up to the closest major rank
-            my_priority = RANK_PRIORITY.get(self.rank, 999)
-            required_major_ranks = [
-                r for r in MAJOR_RANKS if RANK_PRIORITY.get(r, 999) < my_priority
-            ]
-
-        for required_rank in required_major_ranks:
-            if required_rank not in path_ranks:
-                return False
-
-        return True
+        # Walk up OR-ing in rank bits until every required bit is set
+        required = self._required_rank_mask()
+        path_mask = 0
+        node: TaxonomyNode | None = self
+        while node is not None:
+            path_mask |= _RANK_BITS.get(node.rank, 0)
+            if path_mask & required == required:
+                return True
+            node = node.parent
+
+        return False
 
     def __repr__(self) -> str:
         return f"TaxonomyNode({self.name!r}, rank={self.rank!r}, children={len(self.children)})"
@@ -172,6 +200,9 @@ class GBIFTaxonomyTree:
         # Index by name for search
         self._nodes_by_name: dict[str, list[TaxonomyNode]] = {}
 
+        # Lowercased name -> nodes, built on the first case-insensitive search
+        self._nodes_by_lower_name: dict[str, list[TaxonomyNode]] | None = None
+
         # Statistics
         self.stats: dict[str, int] = {
             "taxa_processed": 0,
@@ -187,6 +218,7 @@ class GBIFTaxonomyTree:
         if node.name not in self._nodes_by_name:
             self._nodes_by_name[node.name] = []
         self._nodes_by_name[node.name].append(node)
+        self._nodes_by_lower_name = None
 
     def find_by_id(self, taxon_id: str) -> TaxonomyNode | None:
         """Find a node by its GBIF taxon ID."""
@@ -206,12 +238,15 @@ class GBIFTaxonomyTree:
             return self._nodes_by_name.get(name, [])
         
         # Case-insensitive search
-        name_lower = name.lower()
-        results = []
-        for stored_name, nodes in self._nodes_by_name.items():
-            if stored_name.lower() == name_lower:
-                results.extend(nodes)
-        return results
+        if self._nodes_by_lower_name is None:
+            by_lower_name: dict[str, list[TaxonomyNode]] = {}
+            for stored_name, nodes in self._nodes_by_name.items():
+                name_lower = stored_name.lower()
+                if name_lower not in by_lower_name:
+                    by_lower_name[name_lower] = []
+                by_lower_name[name_lower].extend(nodes)
+            self._nodes_by_lower_name = by_lower_name
+        return list(self._nodes_by_lower_name.get(name.lower(), []))
 
     @classmethod
     def from_backbone(
@@ -220,17 +255,24 @@ class GBIFTaxonomyTree:
         *,
         accepted_only: bool = True,
         progress_interval: int = 500000,
+        use_arrow: bool = False,
+        workers: int = 1,
     ) -> GBIFTaxonomyTree:
         """Build a taxonomy tree from the GBIF Backbone.
 
         Uses a two-pass approach:
-        1. First pass: Create all nodes
-        2. Second pass: Link nodes to parents
+        1. First pass: Create all nodes, recording each row's parent ID
+        2. Second pass: Link nodes to parents by row
 
         Args:
             backbone: The GBIFBackbone instance to read from.
             accepted_only: If True, only include accepted taxa.
             progress_interval: Print progress every N taxa.
+            use_arrow: If True, read the needed columns with pyarrow
+                instead of the csv module.
+            workers: If greater than 1, parse Taxon.tsv in this many worker
+                processes (see GBIFBackbone.iter_taxon_rows_parallel()).
+                Ignored with use_arrow, which already parses on threads.
 
         Returns:
             A populated GBIFTaxonomyTree.
@@ -239,55 +281,94 @@ class GBIFTaxonomyTree:
 
         # First pass: Create all nodes
         print("  Pass 1: Creating nodes...")
-        pending_links: list[tuple[str, str]] = []  # (child_id, parent_id)
+        # Row-aligned: the node created for each taxon and its parent, held
+        # as the parent node if it was created earlier, else as its ID
+        nodes_by_id = tree._nodes_by_id
+        nodes: list[TaxonomyNode] = []
+        parents: list[TaxonomyNode | str] = []
+        # Raw rank -> lowercased rank, so nodes share one string per rank
+        ranks: dict[str, str] = {}
+
+        # (id, parent_id, canonical_name, scientific_name, rank, status) per taxon
+        columns = (
+            "taxonID", "parentNameUsageID", "canonicalName",
+            "scientificName", "taxonRank", "taxonomicStatus",
+        )
+        records: Iterable[tuple[str, ...]]
+        if use_arrow:
+            batches = backbone.iter_taxon_batches(columns, accepted_only=accepted_only)
+            records = itertools.chain.from_iterable(zip(*batch) for batch in batches)
+        elif workers > 1:
+            records = backbone.iter_taxon_rows_parallel(
+                columns, accepted_only=accepted_only, workers=workers
+            )
+        else:
+            records = backbone.iter_taxon_rows(columns, accepted_only=accepted_only)
+
+        # Counted in locals and stored in tree.stats after each pass
+        taxa_processed = 0
+        accepted_taxa = 0
+        next_progress = progress_interval or -1
 
-        for taxon in backbone.iter_taxa(accepted_only=accepted_only):
-            tree.stats["taxa_processed"] += 1
+        for taxon_id, parent_id, canonical_name, scientific_name, rank, status in records:
+            taxa_processed += 1
 
-            if taxon.is_accepted:
-                tree.stats["accepted_taxa"] += 1
+            if status == "accepted":
+                accepted_taxa += 1
 
             # Create node
+            node_rank = ranks.get(rank)
+            if node_rank is None:
+                node_rank = ranks[rank] = rank.lower()
             node = TaxonomyNode(
-                id=taxon.id,
-                name=taxon.canonical_name or taxon.scientific_name,
-                rank=taxon.rank.lower() if taxon.rank else "",
-                scientific_name=taxon.scientific_name,
+                id=taxon_id,
+                name=canonical_name or scientific_name,
+                rank=node_rank,
+                scientific_name=scientific_name,
             )
             tree._register_node(node)
-            tree.stats["nodes_created"] += 1
 
-            # Record parent link for second pass
-            if taxon.parent_id:
-                pending_links.append((taxon.id, taxon.parent_id))
+            # Record parent link for second pass. Resolving it now when
+            # possible lets the parent ID string be freed right away.
+            nodes.append(node)
+            parents.append(nodes_by_id.get(parent_id, parent_id) if parent_id else "")
 
-            if progress_interval and tree.stats["taxa_processed"] % progress_interval == 0:
-                print(f"    Processed {tree.stats['taxa_processed']:,} taxa...")
+            if taxa_processed == next_progress:
+                print(f"    Processed {taxa_processed:,} taxa...")
+                next_progress += progress_interval
 
+        # One node is created per taxon
+        tree.stats["taxa_processed"] = taxa_processed
+        tree.stats["accepted_taxa"] = accepted_taxa
+        tree.stats["nodes_created"] = taxa_processed
         print(f"    Created {tree.stats['nodes_created']:,} nodes")
 
         # Second pass: Link nodes to parents
         print("  Pass 2: Linking nodes to parents...")
 
-        linked_ids = set()
-        for child_id, parent_id in pending_links:
-            child_node = tree._nodes_by_id.get(child_id)
-            parent_node = tree._nodes_by_id.get(parent_id)
-
-            if child_node and parent_node:
-                parent_node.add_child(child_node)
-                tree.stats["nodes_linked"] += 1
-                linked_ids.add(child_id)
-            elif child_node:
+        nodes_linked = 0
+        for node, parent in zip(nodes, parents):
+            if isinstance(parent, str):
+                if not parent:
+                    continue
+                parent_node = nodes_by_id.get(parent)
+            else:
+                parent_node = parent
+
+            if parent_node:
+                parent_node.add_child(node)
+                nodes_linked += 1
+            else:
                 # Parent not found (might be filtered out), attach to root
-                tree.root.add_child(child_node)
-                linked_ids.add(child_id)
+                tree.root.add_child(node)
+        del nodes, parents
 
         # Attach any unlinked nodes (no parent ID) to root
-        for node_id, node in tree._nodes_by_id.items():
-            if node_id != "0" and node_id not in linked_ids and node.parent is None:
+        for node in nodes_by_id.values():
+            if node.parent is None and node is not tree.root:
                 tree.root.add_child(node)
 
+        tree.stats["nodes_linked"] = nodes_linked
         print(f"    Linked {tree.stats['nodes_linked']:,} nodes")
 
         # Count orphans (direct children of root that aren't kingdoms/domains)
@@ -300,13 +381,66 @@ class GBIFTaxonomyTree:
 
         return tree
 
+    def get_complete_path_nodes(self, rank: str | None = None) -> list[TaxonomyNode]:
+        """Get all nodes for which has_complete_path() is True.
+
+        Gives the same result as checking every node, but the ranks on the
+        path above each parent are collected once and reused by all of its
+        children instead of walking up from every node.
+
+        Args:
+            rank: If given, only include nodes of this rank.
+
+        Returns:
+            Matching nodes, in the order they were added to the tree.
+        """
+        rank_bits = _RANK_BITS
+        required_masks = _REQUIRED_RANK_MASKS
+        # id(node) -> rank bits of the node and all its ancestors
+        path_masks: dict[int, int] = {}
+
+        def get_path_mask(node: TaxonomyNode) -> int:
+            # Walk up to the first node with a known mask, then fill in
+            # the masks of the nodes passed on the way down
+            chain = []
+            mask = 0
+            current: TaxonomyNode | None = node
+            while current is not None:
+                cached = path_masks.get(id(current))
+                if cached is not None:
+                    mask = cached
+                    break
+                chain.append(current)
+                current = current.parent
+            for current in reversed(chain):
+                mask |= rank_bits.get(current.rank, 0)
+                path_masks[id(current)] = mask
+            return mask
+
+        nodes = []
+        for node in self._nodes_by_id.values():
+            node_rank = node.rank
+            if rank is not None and node_rank != rank:
+                continue
+            mask = rank_bits.get(node_rank, 0)
+            parent = node.parent
+            if parent is not None:
+                parent_mask = path_masks.get(id(parent))
+                mask |= get_path_mask(parent) if parent_mask is None else parent_mask
+            if node_rank == "root" or node_rank == "kingdom":
+                required = node._required_rank_mask()
+            else:
+                required = required_masks.get(node_rank, _ALL_MAJOR_RANKS_MASK)
+            if mask & required == required:
+                nodes.append(node)
+        return nodes
+
     def get_rank_counts(self) -> dict[str, int]:
         """Get the count of nodes at each rank."""
-        counts: dict[str, int] = {}
-        for node in self._nodes_by_id.values():
-            if node.rank and node.rank != "root":
-                counts[node.rank] = counts.get(node.rank, 0) + 1
-        return counts
+        counts = Counter(node.rank for node in self._nodes_by_id.values())
+        counts.pop("", None)
+        counts.pop("root", None)
+        return dict(counts)
 
     def print_subtree(
         self,
@@ -349,15 +483,148 @@ class GBIFTaxonomyTree:
         Returns:
             Number of names added.
         """
+        nodes_by_id = self._nodes_by_id
         count = 0
-        for vn in backbone.iter_vernacular_names():
-            node = self._nodes_by_id.get(vn.taxon_id)
-            if node and vn.name:
+        for taxon_id, name, language in backbone.iter_vernacular_rows(
+            ("taxonID", "vernacularName", "language")
+        ):
+            node = nodes_by_id.get(taxon_id)
+            if node and name:
                 # Prefer English names
-                if vn.language in ("en", "eng", ""):
-                    node.vernacular_names.insert(0, vn.name)
+                if language in ("en", "eng", ""):
+                    node.vernacular_names.insert(0, name)
                 else:
-                    node.vernacular_names.append(vn.name)
+                    node.vernacular_names.append(name)
                 count += 1
         return count
 
+    def save(self, path: str | Path) -> None:
+        """Save the tree to a file that load() can rebuild it from.
+
+        Nodes are stored as flat per-row columns, with each node's children
+        as a slice of row numbers, so loading rebuilds the tree without
+        reading the backbone. Vernacular names and stats are included. A
+        node replaced in the ID index by a later duplicate ID is still saved
+        where it is linked, and the ID and name indices are stored as row
+        numbers so both come back as they were.
+
+        Args:
+            path: File to write.
+        """
+        # Rows 1 to name_rows_end - 1 follow the name index, which holds every
+        # node from_backbone() registered, including ones a duplicate ID
+        # replaced in the ID index
+        nodes = [self.root]
+        for same_name in self._nodes_by_name.values():
+            nodes.extend(same_name)
+        name_rows_end = len(nodes)
+        row_of = {id(node): row for row, node in enumerate(nodes)}
+
+        # Children of row i are children_rows[children_offsets[i]:children_offsets[i + 1]].
+        # A linked child missing from the indices gets a row of its own.
+        children_offsets = array("q", [0])
+        children_rows = array("q")
+        row = 0
+        while row < len(nodes):
+            for child in nodes[row].children.values():
+                child_row = row_of.get(id(child))
+                if child_row is None:
+                    child_row = row_of[id(child)] = len(nodes)
+                    nodes.append(child)
+                children_rows.append(child_row)
+            children_offsets.append(len(children_rows))
+            row += 1
+
+        # The ID index as rows, so an ID maps back to the same node
+        id_rows = array("q", [row_of[id(node)] for node in self._nodes_by_id.values()])
+
+        data = {
+            "version": _SAVE_FORMAT_VERSION,
+            "ids": [node.id for node in nodes],
+            "names": [node.name for node in nodes],
+            "ranks": [node.rank for node in nodes],
+            "scientific_names": [node.scientific_name for node in nodes],
+            "vernacular_names": [node.vernacular_names for node in nodes],
+            "children_offsets": children_offsets,
+            "children_rows": children_rows,
+            "name_rows_end": name_rows_end,
+            "id_rows": id_rows,
+            "stats": self.stats,
+        }
+        with open(path, "wb") as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str | Path) -> GBIFTaxonomyTree:
+        """Load a tree written by save().
+
+        The file is unpickled, so only load files you created.
+
+        Args:
+            path: File written by save().
+
+        Returns:
+            The rebuilt GBIFTaxonomyTree.
+
+        Raises:
+            ValueError: If the file was written in an unsupported format.
+        """
+        # Loading allocates millions of long-lived objects; cyclic GC passes
+        # triggered along the way would only rescan them, so pause GC
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+            if not isinstance(data, dict) or data.get("version") != _SAVE_FORMAT_VERSION:
+                raise ValueError(f"Unsupported taxonomy tree file: {path}")
+            return cls._from_saved(data)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+    @classmethod
+    def _from_saved(cls, data: dict) -> GBIFTaxonomyTree:
+        """Rebuild a tree from the columns written by save()."""
+        tree = cls()
+        tree.root.vernacular_names = data["vernacular_names"][0]
+        nodes = [tree.root]
+        rows = zip(
+            data["ids"],
+            data["names"],
+            data["ranks"],
+            data["scientific_names"],
+            data["vernacular_names"],
+        )
+        for taxon_id, name, rank, scientific_name, vernacular_names in itertools.islice(
+            rows, 1, None
+        ):
+            node = TaxonomyNode(
+                id=taxon_id,
+                name=name,
+                rank=rank,
+                scientific_name=scientific_name,
+                vernacular_names=vernacular_names,
+            )
+            nodes.append(node)
+
+        nodes_by_name = tree._nodes_by_name
+        for node in itertools.islice(nodes, 1, data["name_rows_end"]):
+            same_name = nodes_by_name.get(node.name)
+            if same_name is None:
+                nodes_by_name[node.name] = [node]
+            else:
+                same_name.append(node)
+        tree._nodes_by_id = {nodes[row].id: nodes[row] for row in data["id_rows"]}
+
+        children_offsets = data["children_offsets"]
+        children_rows = data["children_rows"]
+        for row, parent in enumerate(nodes):
+            children = parent.children
+            for child_row in children_rows[children_offsets[row]:children_offsets[row + 1]]:
+                child = nodes[child_row]
+                child.parent = parent
+                children[child.id] = child
+
+        tree.stats = data["stats"]
+        return tree
@@ -18,7 +18,10 @@ The score can be used to stratify species for different difficulty levels:
 from __future__ import annotations
 
 import csv
+import heapq
+import math
 import sys
+from array import array
 from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -26,11 +29,104 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    import pyarrow as pa
+
 # Increase CSV field size limit
 csv.field_size_limit(sys.maxsize)
 
+# Minimum popularity score per difficulty tier (inclusive - each tier
+# includes easier tiers)
+DIFFICULTY_THRESHOLDS = {
+    "easy": 55,    # Top 1%
+    "medium": 49,  # Top 5%
+    "hard": 24,    # Top 25%
+    "expert": 0,   # All species
+}
+
+# Difficulty tiers, easiest first; a taxon's tier code is its position here
+_TIERS = ("easy", "medium", "hard", "expert")
+
+# Column positions in the Wikipedia DwC-A data files. Every file has the
+# taxon ID first; lines are split no further than the last column we read.
+_ID_COLUMN = 0
+_TAXON_NAME_COLUMN = 3        # taxon.txt: scientificName
+_DESCRIPTION_TEXT_COLUMN = 3  # description.txt: description
+_VERNACULAR_NAME_COLUMN = 3   # vernacularname.txt: vernacularName
+
+
+def _read_tsv_columns(path: Path, columns: tuple[int, ...]) -> pa.Table:
+    """Read columns of a headerless, unquoted TSV file with pyarrow.
+    
+    Columns are read as strings, in the order given. Rows whose column
+    count differs from the first row are skipped.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    
+    names = [f"f{i}" for i in columns]
+    return pa_csv.read_csv(
+        path,
+        read_options=pa_csv.ReadOptions(autogenerate_column_names=True),
+        parse_options=pa_csv.ParseOptions(
+            delimiter="\t",
+            quote_char=False,
+            invalid_row_handler=lambda row: "skip",
+        ),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=names,
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=False,
+        ),
+    ).select(names)
+
+
+def _popularity_score(
+    description_length: int,
+    section_count: int,
+    has_vernacular: bool,
+    multimedia_count: int,
+) -> float:
+    """Compute the 0-100 popularity score from raw metric values.
+    
+    See PopularityMetrics.popularity_score for the component weights.
+    """
+    score = 0.0
+    
+    # Description length (0-20 points) - reduced from 40
+    # Scale: 100 chars = ~1.3 pt, 1000 chars = ~6.5 pts, 10000+ chars = 20 pts
+    if description_length > 0:
+        desc_score = min(20, math.log10(description_length) * 6.5)
+        score += desc_score
+    
+    # Section count (0-10 points) - reduced from 20
+    # 1 section = 1 pt, 5 sections = 5 pts, 10+ sections = 10 pts
+    score += min(10, section_count * 1)
+    
+    # Vernacular name (0-25 points)
+    # Having a common name is a strong indicator of recognition
+    if has_vernacular:
+        score += 25
+    
+    # Multimedia (0-30 points) - doubled from 15
+    # 1 image = 6 pts, 5+ images = 30 pts
+    score += min(30, multimedia_count * 6)
+    
+    return min(100, score)
+
+
+def _difficulty_tier(score: float) -> str:
+    """Map a popularity score to its difficulty tier."""
+    if score >= 55:
+        return "easy"
+    elif score >= 49:
+        return "medium"
+    elif score >= 24:
+        return "hard"
+    else:
+        return "expert"
+
 
-@dataclass
+@dataclass(slots=True)
 class PopularityMetrics:
     """Popularity metrics for a Wikipedia taxon entry."""
     
@@ -56,29 +152,12 @@ class PopularityMetrics:
         - Vernacular name: 0-25 points (binary)
         - Multimedia: 0-30 points
         """
-        score = 0.0
-        
-        # Description length (0-20 points) - reduced from 40
-        # Scale: 100 chars = ~1.3 pt, 1000 chars = ~6.5 pts, 10000+ chars = 20 pts
-        if self.description_length > 0:
-            import math
-            desc_score = min(20, math.log10(self.description_length) * 6.5)
-            score += desc_score
-        
-        # Section count (0-10 points) - reduced from 20
-        # 1 section = 1 pt, 5 sections = 5 pts, 10+ sections = 10 pts
-        score += min(10, self.section_count * 1)
-        
-        # Vernacular name (0-25 points)
-        # Having a common name is a strong indicator of recognition
-        if self.has_vernacular:
-            score += 25
-        
-        # Multimedia (0-30 points) - doubled from 15
-        # 1 image = 6 pts, 5+ images = 30 pts
-        score += min(30, self.multimedia_count * 6)
-        
-        return min(100, score)
+        return _popularity_score(
+            self.description_length,
+            self.section_count,
+            self.has_vernacular,
+            self.multimedia_count,
+        )
     
     @property
     def difficulty_tier(self) -> str:
@@ -93,15 +172,7 @@ class PopularityMetrics:
         Returns:
             "easy", "medium", "hard", or "expert"
         """
-        score = self.popularity_score
-        if score >= 55:
-            return "easy"
-        elif score >= 49:
-            return "medium"
-        elif score >= 24:
-            return "hard"
-        else:
-            return "expert"
+        return _difficulty_tier(self.popularity_score)
 
 
 class PopularityIndex:
@@ -110,6 +181,10 @@ class PopularityIndex:
     This class loads and indexes popularity metrics from the Wikipedia
     DwC-A dataset, allowing efficient lookup by taxon ID or scientific name.
     
+    Metrics are stored column-wise: one compact array per metric, with
+    row i of every column describing the same taxon. PopularityMetrics
+    objects are only built for the taxa a lookup or query returns.
+    
     Example:
         >>> index = PopularityIndex.from_wikipedia_dwca("wikipedia-en-dwca")
         >>> metrics = index.get_by_name("Panthera leo")
@@ -118,109 +193,274 @@ class PopularityIndex:
     """
     
     def __init__(self) -> None:
-        self._by_id: dict[str, PopularityMetrics] = {}
+        self._row_by_id: dict[str, int] = {}  # taxon_id -> row
+        self._taxon_ids: list[str] = []
+        self._scientific_names: list[str] = []
+        self._description_lengths = array("q")
+        self._section_counts = array("l")
+        self._has_vernacular = bytearray()
+        self._vernacular_names: list[str] = []
+        self._multimedia_counts = array("l")
         self._by_name: dict[str, list[str]] = {}  # name -> list of taxon_ids
+        # Score and tier-code columns derived from the metric columns,
+        # built on first use
+        self._score_column: array | None = None
+        self._tier_codes: bytearray | None = None
+        # (difficulty, min_sections) -> candidate names, built on first use
+        self._tier_cache: dict[tuple[str, int], frozenset[str]] = {}
+    
+    def _add_taxon(self, taxon_id: str, scientific_name: str) -> None:
+        """Add a taxon row with zeroed metrics, resetting it if already present."""
+        self._score_column = None
+        self._tier_codes = None
+        self._tier_cache.clear()
+        
+        row = self._row_by_id.get(taxon_id)
+        if row is None:
+            self._row_by_id[taxon_id] = len(self._taxon_ids)
+            self._taxon_ids.append(taxon_id)
+            self._scientific_names.append(scientific_name)
+            self._description_lengths.append(0)
+            self._section_counts.append(0)
+            self._has_vernacular.append(0)
+            self._vernacular_names.append("")
+            self._multimedia_counts.append(0)
+        else:
+            self._scientific_names[row] = scientific_name
+            self._description_lengths[row] = 0
+            self._section_counts[row] = 0
+            self._has_vernacular[row] = 0
+            self._vernacular_names[row] = ""
+            self._multimedia_counts[row] = 0
+        
+        # Index by name
+        name_key = scientific_name.lower()
+        if name_key not in self._by_name:
+            self._by_name[name_key] = []
+        self._by_name[name_key].append(taxon_id)
+    
+    def _metrics(self, row: int) -> PopularityMetrics:
+        """Build the PopularityMetrics for one row."""
+        return PopularityMetrics(
+            taxon_id=self._taxon_ids[row],
+            scientific_name=self._scientific_names[row],
+            description_length=self._description_lengths[row],
+            section_count=self._section_counts[row],
+            has_vernacular=bool(self._has_vernacular[row]),
+            vernacular_name=self._vernacular_names[row],
+            multimedia_count=self._multimedia_counts[row],
+        )
+    
+    def _scores(self) -> tuple[array, bytearray]:
+        """Get the popularity score and tier code of every row.
+        
+        Both columns are computed in one pass on first use and cached
+        until a taxon is added.
+        """
+        if self._score_column is None or self._tier_codes is None:
+            scores = array(
+                "d",
+                map(
+                    _popularity_score,
+                    self._description_lengths,
+                    self._section_counts,
+                    self._has_vernacular,
+                    self._multimedia_counts,
+                ),
+            )
+            tier_code = _TIERS.index
+            self._tier_codes = bytearray(tier_code(_difficulty_tier(s)) for s in scores)
+            self._score_column = scores
+        return self._score_column, self._tier_codes
     
     @classmethod
-    def from_wikipedia_dwca(cls, path: str | Path) -> PopularityIndex:
+    def from_wikipedia_dwca(cls, path: str | Path, *, use_arrow: bool = False) -> PopularityIndex:
         """Build popularity index from Wikipedia DwC-A directory.
         
         Args:
             path: Path to the Wikipedia DwC-A directory.
+            use_arrow: If True, parse and aggregate the files column-wise
+                with pyarrow (the ``arrow`` extra) instead of line by line.
             
         Returns:
             Populated PopularityIndex.
         """
         path = Path(path)
+        if use_arrow:
+            return cls._from_wikipedia_dwca_arrow(path)
         index = cls()
         
         # Step 1: Load taxon names
         print("  Loading taxon names...")
+        add_taxon = index._add_taxon
         taxon_file = path / "taxon.txt"
         if taxon_file.exists():
             with open(taxon_file, encoding="utf-8") as f:
                 for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) >= 4:
-                        taxon_id = parts[0]
-                        scientific_name = parts[3] if len(parts) > 3 else ""
+                    parts = line.strip().split("\t", _TAXON_NAME_COLUMN + 1)
+                    if len(parts) > _TAXON_NAME_COLUMN:
+                        taxon_id = parts[_ID_COLUMN]
                         
                         # Skip synonyms
                         if "-syn" in taxon_id:
                             continue
                         
-                        index._by_id[taxon_id] = PopularityMetrics(
-                            taxon_id=taxon_id,
-                            scientific_name=scientific_name,
-                        )
-                        
-                        # Index by name
-                        name_key = scientific_name.lower()
-                        if name_key not in index._by_name:
-                            index._by_name[name_key] = []
-                        index._by_name[name_key].append(taxon_id)
+                        add_taxon(taxon_id, parts[_TAXON_NAME_COLUMN])
         
-        print(f"    Loaded {len(index._by_id):,} taxa")
+        print(f"    Loaded {len(index._taxon_ids):,} taxa")
+        row_by_id = index._row_by_id
         
         # Step 2: Load description metrics
         print("  Loading description metrics...")
         desc_file = path / "description.txt"
         if desc_file.exists():
+            description_lengths = index._description_lengths
+            section_counts = index._section_counts
             with open(desc_file, encoding="utf-8") as f:
                 for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) >= 4:
-                        taxon_id = parts[0]
-                        text = parts[3] if len(parts) > 3 else ""
-                        
-                        if taxon_id in index._by_id:
-                            metrics = index._by_id[taxon_id]
-                            metrics.description_length += len(text)
-                            metrics.section_count += 1
+                    parts = line.strip().split("\t", _DESCRIPTION_TEXT_COLUMN + 1)
+                    if len(parts) > _DESCRIPTION_TEXT_COLUMN:
+                        row = row_by_id.get(parts[_ID_COLUMN])
+                        if row is not None:
+                            description_lengths[row] += len(parts[_DESCRIPTION_TEXT_COLUMN])
+                            section_counts[row] += 1
         
         # Step 3: Load vernacular names
         print("  Loading vernacular names...")
         vn_file = path / "vernacularname.txt"
         if vn_file.exists():
+            has_vernacular = index._has_vernacular
+            vernacular_names = index._vernacular_names
             with open(vn_file, encoding="utf-8") as f:
                 for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) >= 4:
-                        taxon_id = parts[0]
-                        name = parts[3] if len(parts) > 3 else ""
-                        
-                        if taxon_id in index._by_id and name:
-                            metrics = index._by_id[taxon_id]
-                            metrics.has_vernacular = True
-                            if not metrics.vernacular_name:
-                                metrics.vernacular_name = name
+                    parts = line.strip().split("\t", _VERNACULAR_NAME_COLUMN + 1)
+                    if len(parts) > _VERNACULAR_NAME_COLUMN:
+                        name = parts[_VERNACULAR_NAME_COLUMN]
+                        row = row_by_id.get(parts[_ID_COLUMN])
+                        if row is not None and name:
+                            has_vernacular[row] = 1
+                            if not vernacular_names[row]:
+                                vernacular_names[row] = name
         
         # Step 4: Load multimedia counts
         print("  Loading multimedia counts...")
         mm_file = path / "multimedia.txt"
         if mm_file.exists():
+            multimedia_counts = index._multimedia_counts
             with open(mm_file, encoding="utf-8") as f:
                 for line in f:
-                    parts = line.strip().split("\t")
-                    if len(parts) >= 1:
-                        taxon_id = parts[0]
-                        if taxon_id in index._by_id:
-                            index._by_id[taxon_id].multimedia_count += 1
+                    taxon_id = line.strip().split("\t", 1)[_ID_COLUMN]
+                    row = row_by_id.get(taxon_id)
+                    if row is not None:
+                        multimedia_counts[row] += 1
+        
+        return index
+    
+    @classmethod
+    def _from_wikipedia_dwca_arrow(cls, path: Path) -> PopularityIndex:
+        """Build popularity index with pyarrow, aggregating per taxon in C++.
+        
+        Same result as the line-by-line loader for well-formed files; rows
+        with a different column count than the first row of their file are
+        skipped rather than read.
+        """
+        try:
+            import pyarrow as pa
+            import pyarrow.compute as pc
+        except ImportError as e:
+            raise ImportError(
+                "Arrow parsing requires pyarrow. Install it with: pip install 'taxonomica[arrow]'"
+            ) from e
+        
+        index = cls()
+        row_by_id = index._row_by_id
+        
+        def read(filename: str, columns: tuple[int, ...]) -> pa.Table | None:
+            file_path = path / filename
+            if not file_path.exists() or file_path.stat().st_size == 0:
+                return None
+            return _read_tsv_columns(file_path, columns)
+        
+        # Step 1: Load taxon names, skipping synonyms
+        print("  Loading taxon names...")
+        table = read("taxon.txt", (_ID_COLUMN, _TAXON_NAME_COLUMN))
+        if table is not None:
+            ids, names = table.columns
+            accepted = pc.invert(pc.match_substring(ids, "-syn"))
+            ids = ids.filter(accepted).to_pylist()
+            names = names.filter(accepted).to_pylist()
+            for taxon_id, scientific_name in zip(ids, names):
+                index._add_taxon(taxon_id, scientific_name)
+        
+        print(f"    Loaded {len(index._taxon_ids):,} taxa")
+        
+        # Step 2: Sum description lengths and count sections per taxon
+        print("  Loading description metrics...")
+        table = read("description.txt", (_ID_COLUMN, _DESCRIPTION_TEXT_COLUMN))
+        if table is not None:
+            ids, texts = table.columns
+            totals = (
+                pa.table({"id": ids, "length": pc.utf8_length(texts)})
+                .group_by("id")
+                .aggregate([("length", "sum"), ("length", "count")])
+            )
+            for taxon_id, length, count in zip(
+                totals.column("id").to_pylist(),
+                totals.column("length_sum").to_pylist(),
+                totals.column("length_count").to_pylist(),
+            ):
+                row = row_by_id.get(taxon_id)
+                if row is not None:
+                    index._description_lengths[row] += length
+                    index._section_counts[row] += count
+        
+        # Step 3: Load vernacular names (the first non-empty one per taxon)
+        print("  Loading vernacular names...")
+        table = read("vernacularname.txt", (_ID_COLUMN, _VERNACULAR_NAME_COLUMN))
+        if table is not None:
+            ids, names = table.columns
+            named = pc.not_equal(names, "")
+            ids = ids.filter(named).to_pylist()
+            names = names.filter(named).to_pylist()
+            for taxon_id, name in zip(ids, names):
+                row = row_by_id.get(taxon_id)
+                if row is not None:
+                    index._has_vernacular[row] = 1
+                    if not index._vernacular_names[row]:
+                        index._vernacular_names[row] = name
+        
+        # Step 4: Count multimedia records per taxon
+        print("  Loading multimedia counts...")
+        table = read("multimedia.txt", (_ID_COLUMN,))
+        if table is not None:
+            counts = pc.value_counts(table.column(0))
+            for taxon_id, count in zip(
+                counts.field("values").to_pylist(), counts.field("counts").to_pylist()
+            ):
+                row = row_by_id.get(taxon_id)
+                if row is not None:
+                    index._multimedia_counts[row] += count
         
         return index
     
     def get_by_id(self, taxon_id: str) -> PopularityMetrics | None:
         """Get metrics by taxon ID."""
-        return self._by_id.get(taxon_id)
+        row = self._row_by_id.get(taxon_id)
+        return None if row is None else self._metrics(row)
     
     def get_by_name(self, name: str) -> PopularityMetrics | None:
         """Get metrics by scientific name (case-insensitive)."""
         name_key = name.lower()
         if name_key in self._by_name:
             taxon_id = self._by_name[name_key][0]
-            return self._by_id.get(taxon_id)
+            return self.get_by_id(taxon_id)
         return None
     
+    def iter_metrics(self) -> Iterator[PopularityMetrics]:
+        """Iterate over the metrics of every taxon, in load order."""
+        for row in range(len(self._taxon_ids)):
+            yield self._metrics(row)
+    
     def iter_by_difficulty(
         self,
         tier: str,
@@ -235,22 +475,52 @@ class PopularityIndex:
         Yields:
             PopularityMetrics for matching taxa
         """
-        for metrics in self._by_id.values():
-            if metrics.difficulty_tier == tier and metrics.section_count >= min_sections:
-                yield metrics
+        if tier not in _TIERS:
+            return
+        code = _TIERS.index(tier)
+        _, tier_codes = self._scores()
+        section_counts = self._section_counts
+        row = tier_codes.find(code)
+        while row != -1:
+            if section_counts[row] >= min_sections:
+                yield self._metrics(row)
+            row = tier_codes.find(code, row + 1)
+    
+    def candidates_for(self, difficulty: str, min_sections: int = 2) -> frozenset[str]:
+        """Get lowercased scientific names eligible for a difficulty.
+        
+        Tiers are inclusive, so "medium" also contains the "easy" names.
+        The set is computed on the first call and cached for reuse.
+        
+        Args:
+            difficulty: Difficulty tier ("easy", "medium", "hard", "expert").
+            min_sections: Minimum number of description sections required.
+            
+        Returns:
+            Frozen set of lowercased scientific names.
+        """
+        key = (difficulty, min_sections)
+        names = self._tier_cache.get(key)
+        if names is None:
+            min_score = DIFFICULTY_THRESHOLDS.get(difficulty, 0)
+            names = frozenset(
+                name.lower()
+                for name, score, sections in zip(
+                    self._scientific_names, self._scores()[0], self._section_counts
+                )
+                if score >= min_score and sections >= min_sections
+            )
+            self._tier_cache[key] = names
+        return names
     
     def get_stats(self) -> dict[str, int]:
         """Get count of taxa by difficulty tier."""
-        stats = {"easy": 0, "medium": 0, "hard": 0, "expert": 0}
-        for metrics in self._by_id.values():
-            stats[metrics.difficulty_tier] += 1
-        return stats
+        _, tier_codes = self._scores()
+        return {tier: tier_codes.count(code) for code, tier in enumerate(_TIERS)}
     
     def get_top_popular(self, n: int = 100) -> list[PopularityMetrics]:
         """Get the top N most popular taxa."""
-        return sorted(
-            self._by_id.values(),
-            key=lambda m: m.popularity_score,
-            reverse=True,
-        )[:n]
+        scores, _ = self._scores()
+        rows = heapq.nlargest(n, range(len(scores)), key=scores.__getitem__)
+        return [self._metrics(row) for row in rows]
 
@@ -8,10 +8,24 @@ progressively guess the taxonomy to reveal more information.
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
+try:
+    import ahocorasick
+except ImportError:  # Optional: pip install 'taxonomica[ahocorasick]'
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:  # Optional: pip install 'taxonomica[re2]'
+    re2 = None
+
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
     from taxonomica.gbif_tree import TaxonomyNode
 
 # Standard taxonomic ranks in order from highest to lowest
@@ -26,6 +40,21 @@ TAXONOMIC_RANKS = [
     "subspecies",
 ]
 
+# Minimum number of terms before TermMatcher switches from a regex
+# alternation to an Aho-Corasick automaton (when pyahocorasick is installed)
+AHOCORASICK_MIN_TERMS = 8
+
+# Maximum number of terms TermMatcher finds with one str.find scan per term,
+# instead of an re alternation, when not matching word boundaries (RE2
+# overtakes the scans sooner, from AHOCORASICK_MIN_TERMS terms)
+LITERAL_SCAN_MAX_TERMS = 16
+
+# Number of revealed-rank sets whose matchers each Redactor keeps cached
+REDACTOR_CACHE_SIZE = 16
+
+# Terms (and words of names) shorter than this are never redacted
+MIN_TERM_LENGTH = 3
+
 # Common vernacular equivalents for taxonomic terms
 # These are added automatically based on scientific names
 VERNACULAR_MAPPINGS: dict[str, list[str]] = {
@@ -96,6 +125,16 @@ VERNACULAR_MAPPINGS: dict[str, list[str]] = {
     "Corvidae": ["crow", "crows", "raven", "ravens", "corvid", "corvids"],
 }
 
+# Redaction terms contributed by each VERNACULAR_MAPPINGS entry: the
+# vernacular names plus their words, expanded once at import
+_VERNACULAR_TERMS: dict[str, frozenset[str]] = {
+    name: frozenset(
+        [*vernaculars]
+        + [part for vn in vernaculars for part in vn.split() if len(part) >= MIN_TERM_LENGTH]
+    )
+    for name, vernaculars in VERNACULAR_MAPPINGS.items()
+}
+
 
 @dataclass
 class RedactionTerms:
@@ -112,8 +151,8 @@ class RedactionTerms:
     
     def add_terms(self, rank: str, terms: list[str]) -> None:
         """Add multiple terms to redact at a given rank."""
-        for term in terms:
-            self.add_term(rank, term)
+        if terms:
+            self.terms_by_rank.setdefault(rank, set()).update(terms)
     
     def get_terms_for_ranks(self, ranks: set[str]) -> set[str]:
         """Get all terms for the specified ranks."""
@@ -125,10 +164,30 @@ class RedactionTerms:
     
     def get_all_terms(self) -> set[str]:
         """Get all terms across all ranks."""
-        terms = set()
-        for rank_terms in self.terms_by_rank.values():
-            terms.update(rank_terms)
-        return terms
+        return set().union(*self.terms_by_rank.values())
+
+
+def _add_name_with_parts(
+    terms: RedactionTerms, rank: str, name: str, *, lowercase_parts: bool = False
+) -> None:
+    """Add a name and its words longer than two characters to a rank.
+    
+    Args:
+        terms: The RedactionTerms to add to.
+        rank: Rank the name belongs to.
+        name: The name to add.
+        lowercase_parts: If True, also add lowercase copies of the words.
+    """
+    rank_terms = terms.terms_by_rank.get(rank)
+    if rank_terms is None:
+        rank_terms = terms.terms_by_rank[rank] = set()
+    
+    rank_terms.add(name)
+    for part in name.split():
+        if len(part) >= MIN_TERM_LENGTH:
+            rank_terms.add(part)
+            if lowercase_parts:
+                rank_terms.add(part.lower())
 
 
 def build_redaction_terms_from_node(node: TaxonomyNode) -> RedactionTerms:
@@ -158,35 +217,17 @@ def build_redaction_terms_from_node(node: TaxonomyNode) -> RedactionTerms:
         rank = ancestor.rank
         name = ancestor.name
         
-        # Add scientific name
-        terms.add_term(rank, name)
-        
-        # Add parts of binomial names
-        name_parts = name.split()
-        for part in name_parts:
-            if len(part) > 2:  # Skip very short parts
-                terms.add_term(rank, part)
+        # Add scientific name and the parts of binomial names
+        _add_name_with_parts(terms, rank, name)
         
-        # Add vernacular names from GBIF data
+        # Add vernacular names from GBIF data, also in lowercase
         if hasattr(ancestor, 'vernacular_names') and ancestor.vernacular_names:
             for vn in ancestor.vernacular_names:
-                terms.add_term(rank, vn)
-                # Also add lowercase version
+                _add_name_with_parts(terms, rank, vn, lowercase_parts=True)
                 terms.add_term(rank, vn.lower())
-                # Split into component words
-                for part in vn.split():
-                    if len(part) > 2:
-                        terms.add_term(rank, part)
-                        terms.add_term(rank, part.lower())
         
         # Add common vernacular mappings
-        if name in VERNACULAR_MAPPINGS:
-            for vn in VERNACULAR_MAPPINGS[name]:
-                terms.add_term(rank, vn)
-                # Split into component words
-                for part in vn.split():
-                    if len(part) > 2:
-                        terms.add_term(rank, part)
+        terms.add_terms(rank, _VERNACULAR_TERMS.get(name, ()))
     
     return terms
 
@@ -212,37 +253,258 @@ def build_redaction_terms_manual(
     terms = RedactionTerms()
     
     for rank, name in scientific_hierarchy.items():
-        # Add scientific name
-        terms.add_term(rank, name)
-        
-        # Add parts of name
-        for part in name.split():
-            if len(part) > 2:
-                terms.add_term(rank, part)
+        # Add scientific name and its parts
+        _add_name_with_parts(terms, rank, name)
         
         # Add vernacular mappings
-        if name in VERNACULAR_MAPPINGS:
-            for vn in VERNACULAR_MAPPINGS[name]:
-                terms.add_term(rank, vn)
-                # Split into component words
-                for part in vn.split():
-                    if len(part) > 2:
-                        terms.add_term(rank, part)
+        terms.add_terms(rank, _VERNACULAR_TERMS.get(name, ()))
     
     # Add custom vernacular names
     if vernacular_names:
         for rank, names in vernacular_names.items():
             for name in names:
-                terms.add_term(rank, name)
-                # Split into component words
-                for part in name.split():
-                    if len(part) > 2:
-                        terms.add_term(rank, part)
-                        terms.add_term(rank, part.lower())
+                _add_name_with_parts(terms, rank, name, lowercase_parts=True)
     
     return terms
 
 
+def _is_word_char(char: str) -> bool:
+    """Check if a character counts as a word character for regex \\b."""
+    return char.isalnum() or char == "_"
+
+
+def _replace_spans(
+    text: str, spans: list[tuple[int, int]], repl: str | Callable[[int], str]
+) -> str:
+    """Replace sorted, non-overlapping (start, end) spans of text.
+    
+    Args:
+        text: The original text.
+        spans: Spans to replace, in order.
+        repl: Replacement string, or a function of the span length.
+        
+    Returns:
+        Text with each span replaced.
+    """
+    if not spans:
+        return text
+    
+    parts = []
+    pos = 0
+    if isinstance(repl, str):
+        for start, end in spans:
+            parts.append(text[pos:start])
+            parts.append(repl)
+            pos = end
+    else:
+        # The replacement depends only on the length, so call repl once
+        # per distinct length rather than once per span
+        markers: dict[int, str] = {}
+        for start, end in spans:
+            parts.append(text[pos:start])
+            length = end - start
+            marker = markers.get(length)
+            if marker is None:
+                marker = markers[length] = repl(length)
+            parts.append(marker)
+            pos = end
+    parts.append(text[pos:])
+    return "".join(parts)
+
+
+# Lowercase characters that re.IGNORECASE treats as equal to a different
+# lowercase character (CPython's re/_casefix.py), mapped to that character
+_CASEFIX_TABLE = str.maketrans({
+    "\u0131": "i",  # dotless i
+    "\u017f": "s",  # long s
+    "\u00b5": "\u03bc",  # micro sign
+    "\u0345": "\u03b9",  # combining ypogegrammeni
+    "\u1fbe": "\u03b9",  # prosgegrammeni
+    "\u03c2": "\u03c3",  # final sigma
+    "\u03d0": "\u03b2",
+    "\u03d1": "\u03b8",
+    "\u03d5": "\u03c6",
+    "\u03d6": "\u03c0",
+    "\u03f0": "\u03ba",
+    "\u03f1": "\u03c1",
+    "\u03f5": "\u03b5",
+    "\u1fd3": "\u0390",
+    "\u1fe3": "\u03b0",
+    "\u1c80": "\u0432",
+    "\u1c81": "\u0434",
+    "\u1c82": "\u043e",
+    "\u1c83": "\u0441",
+    "\u1c84": "\u0442",
+    "\u1c85": "\u0442",
+    "\u1c86": "\u044a",
+    "\u1c87": "\u0463",
+    "\u1c88": "\ua64b",
+    "\u1e9b": "\u1e61",
+    "\ufb05": "\ufb06",
+})
+_CASEFIX_CHARS = tuple(map(chr, _CASEFIX_TABLE))
+
+
+def _fold_case(text: str) -> str:
+    """Case-fold text like re.IGNORECASE, without changing its length.
+    
+    ASCII text is just lowercased. Otherwise U+0130 (İ), the only
+    character whose lowercase is two characters, folds to "i", and the
+    remaining re.IGNORECASE equivalences are applied after lowercasing.
+    """
+    if text.isascii():
+        return text.lower()
+    if "\u0130" in text:
+        text = text.replace("\u0130", "i")
+    text = text.lower()
+    if any(char in text for char in _CASEFIX_CHARS):
+        text = text.translate(_CASEFIX_TABLE)
+    return text
+
+
+# Cached re.escape, since higher-rank terms recur in the matchers of every
+# species that shares them
+_escape = lru_cache(maxsize=8192)(re.escape)
+
+
+class TermMatcher:
+    """Case-insensitive matcher for many literal terms in a single pass.
+    
+    Matches are leftmost and non-overlapping, preferring the longest term
+    at each position (the same result as a longest-first regex
+    alternation). The text is lowercased once and matched against
+    lowercased terms, rather than case-folding inside the regex engine,
+    and replacements are stitched back into the original by offset.
+    Unless there are only a few terms, an Aho-Corasick automaton is used
+    when pyahocorasick is installed, so scanning time does not grow with
+    the number of terms. Otherwise, a few terms without word boundaries
+    are found with one str.find scan per term, and more with a compiled
+    regex alternation.
+    Without word boundaries, that alternation is compiled with RE2
+    (linear-time DFA matching) when google-re2 is installed; RE2's \\b is
+    ASCII-only, so word-boundary matching always uses re.
+    
+    Example:
+        >>> matcher = TermMatcher(["cat", "domestic cat"], word_boundaries=True)
+        >>> matcher.sub("█████", "The domestic cat is a cat.")
+        'The █████ is a █████.'
+    """
+    
+    def __init__(self, terms: Iterable[str], *, word_boundaries: bool = False) -> None:
+        """Build the matcher.
+        
+        Args:
+            terms: Literal terms to match (empty terms are ignored).
+            word_boundaries: If True, only match whole words (like regex \\b).
+        """
+        self.terms = sorted({t for t in terms if t}, key=len, reverse=True)
+        self.word_boundaries = word_boundaries
+        self._literals: list[str] | None = None
+        self._automaton = None
+        self._pattern: re.Pattern | None = None
+        
+        if not self.terms:
+            return
+        
+        # Folding keeps lengths, so the terms stay longest first
+        lowered_terms = list(dict.fromkeys(map(_fold_case, self.terms)))
+        n_terms = len(lowered_terms)
+        if ahocorasick is not None and n_terms >= AHOCORASICK_MIN_TERMS:
+            automaton = ahocorasick.Automaton()
+            for term in lowered_terms:
+                automaton.add_word(term, len(term))
+            automaton.make_automaton()
+            self._automaton = automaton
+        elif not word_boundaries and (
+            n_terms < AHOCORASICK_MIN_TERMS or (re2 is None and n_terms <= LITERAL_SCAN_MAX_TERMS)
+        ):
+            self._literals = lowered_terms
+        elif re2 is not None and not word_boundaries:
+            self._pattern = re2.compile(self._alternation(lowered_terms))
+        else:
+            self._pattern = re.compile(self._alternation(lowered_terms))
+    
+    def _alternation(self, terms: list[str]) -> str:
+        """Build a regex alternation source for the given terms."""
+        alternation = "|".join(map(_escape, terms))
+        if self.word_boundaries:
+            alternation = r"\b(?:" + alternation + r")\b"
+        return alternation
+    
+    def spans(self, text: str) -> list[tuple[int, int]]:
+        """Find the (start, end) spans of all matches in text."""
+        if not self.terms:
+            return []
+        
+        lowered = _fold_case(text)
+        candidates = []
+        if self._literals is not None:
+            # Every occurrence of every term, including overlapping ones
+            for term in self._literals:
+                length = len(term)
+                start = lowered.find(term)
+                while start != -1:
+                    candidates.append((start, -length))
+                    start = lowered.find(term, start + 1)
+        elif self._automaton is None:
+            return [m.span() for m in self._pattern.finditer(lowered)]
+        else:
+            n = len(text)
+            for end, length in self._automaton.iter(lowered):
+                start = end - length + 1
+                end += 1
+                if self.word_boundaries:
+                    before = start > 0 and _is_word_char(text[start - 1])
+                    after = end < n and _is_word_char(text[end])
+                    if (
+                        before == _is_word_char(text[start])
+                        or after == _is_word_char(text[end - 1])
+                    ):
+                        continue
+                candidates.append((start, -length))
+        
+        # Leftmost first, longest first at the same start; skip overlaps
+        candidates.sort()
+        spans = []
+        pos = 0
+        for start, neg_length in candidates:
+            if start >= pos:
+                pos = start - neg_length
+                spans.append((start, pos))
+        return spans
+    
+    def sub(self, repl: str | Callable[[int], str], text: str) -> str:
+        """Replace all matches in text.
+        
+        Argument order mirrors re.Pattern.sub, so a matcher can stand in
+        for a compiled pattern.
+        
+        Args:
+            repl: Replacement string, or a function of the match length.
+            text: The text to process.
+            
+        Returns:
+            Text with all matches replaced.
+        """
+        return _replace_spans(text, self.spans(text), repl)
+    
+    def count(self, text: str) -> int:
+        """Count the matches in text."""
+        return len(self.spans(text))
+
+
+@lru_cache(maxsize=64)
+def _term_matcher(terms: frozenset[str]) -> TermMatcher | None:
+    """Build a substring TermMatcher for a set of terms.
+    
+    Cached by term set: the same hidden terms recur on every turn until
+    the player reveals another rank.
+    """
+    if not terms:
+        return None
+    return TermMatcher(terms)
+
+
 @dataclass
 class Redactor:
     """Applies redaction to text based on taxonomic level.
@@ -261,6 +523,19 @@ class Redactor:
     redaction_marker: str = "█████"
     use_variable_length: bool = False  # If True, marker length matches term
     
+    # Matchers by revealed-rank set, least recently used first
+    _matchers: OrderedDict[frozenset[str], TermMatcher | None] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    # Matcher input terms by rank, filled as ranks are first needed
+    _rank_terms: dict[str, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # (revealed ranks, text, match spans) of the last text scanned
+    _last_spans: tuple[frozenset[str], str, list[tuple[int, int]]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def reveal_rank(self, rank: str) -> None:
         """Mark a rank as revealed (correctly guessed)."""
         self.revealed_ranks.add(rank)
@@ -282,70 +557,152 @@ class Redactor:
         all_ranks = set(self.terms.terms_by_rank.keys())
         return all_ranks - self.revealed_ranks
     
-    def _build_patterns(self) -> list[tuple[re.Pattern, str]]:
-        """Build regex patterns for currently hidden terms.
+    def _rank_match_terms(self, rank: str) -> frozenset[str]:
+        """Get one rank's terms in the form the matcher is built from.
         
-        Uses substring matching (no word boundaries) to catch compound
-        words like "housecat" when redacting "cat". This may cause some
-        over-redaction (e.g., "cat" in "catch") which is acceptable for
-        the game's purposes.
+        Computed once per rank, so a reveal only unions the per-rank sets
+        of the ranks still hidden instead of refiltering every term.
         """
-        hidden_ranks = self.get_hidden_ranks()
-        hidden_terms = self.terms.get_terms_for_ranks(hidden_ranks)
+        terms = self._rank_terms.get(rank)
+        if terms is None:
+            # Matching ignores case, so case variants (e.g. a vernacular name
+            # and its lowercase copy) collapse to one entry
+            terms = frozenset(
+                _fold_case(t)
+                for t in self.terms.terms_by_rank.get(rank, ())
+                if len(t) >= MIN_TERM_LENGTH
+            )
+            self._rank_terms[rank] = terms
+        return terms
+    
+    def _build_matcher(self, key: frozenset[str] | None = None) -> TermMatcher | None:
+        """Build a matcher for all currently hidden terms.
+        
+        Uses case-insensitive substring matching (no word boundaries) to
+        catch compound words like "housecat" when redacting "cat". This may
+        cause some over-redaction (e.g., "cat" in "catch") which is
+        acceptable for the game's purposes. At any position the longest
+        term wins (e.g. "domestic cat" over "cat").
         
-        patterns = []
-        for term in hidden_terms:
-            if not term or len(term) < 3:
-                continue
+        Cached by revealed-rank set, so repeated calls between reveals skip
+        collecting the hidden terms. Terms added to ``self.terms`` after a
+        rank was first redacted are not picked up.
+        
+        Args:
+            key: ``frozenset(self.revealed_ranks)``, if the caller has it.
             
-            # Substring matching (no word boundaries) - catches compound words
-            # Case-insensitive matching
-            try:
-                pattern = re.compile(re.escape(term), re.IGNORECASE)
-                
-                if self.use_variable_length:
-                    # Make marker length proportional to term length
-                    marker = "█" * max(3, len(term))
-                else:
-                    marker = self.redaction_marker
-                
-                patterns.append((pattern, marker))
-            except re.error:
-                # Skip invalid patterns
-                continue
+        Returns:
+            Matcher, or None if no terms are hidden.
+        """
+        if key is None:
+            key = frozenset(self.revealed_ranks)
+        try:
+            self._matchers.move_to_end(key)
+            return self._matchers[key]
+        except KeyError:
+            pass
         
-        # Sort by length (longest first) to avoid partial replacements
-        # This ensures "domestic cat" is replaced before "cat"
-        patterns.sort(key=lambda x: -len(x[0].pattern))
+        hidden_terms = frozenset().union(*(
+            self._rank_match_terms(rank)
+            for rank in self.terms.terms_by_rank
+            if rank not in key
+        ))
+        matcher = _term_matcher(hidden_terms)
+        self._matchers[key] = matcher
+        if len(self._matchers) > REDACTOR_CACHE_SIZE:
+            self._matchers.popitem(last=False)
+        return matcher
+    
+    def _spans(self, text: str) -> list[tuple[int, int]]:
+        """Find the spans of hidden terms in text.
         
-        return patterns
+        The spans of the last text are kept, so redacting and counting the
+        same text with the same revealed ranks (or redacting it again)
+        scans it only once.
+        """
+        key = frozenset(self.revealed_ranks)
+        last = self._last_spans
+        if last is not None and last[0] == key and last[1] == text:
+            return last[2]
+        
+        matcher = self._build_matcher(key)
+        spans = [] if matcher is None else matcher.spans(text)
+        self._last_spans = (key, text, spans)
+        return spans
+    
+    def _replacement(self) -> str | Callable[[int], str]:
+        """Get the marker, or a function of the match length giving it."""
+        if self.use_variable_length:
+            # Make marker length proportional to the matched term
+            return lambda length: "█" * max(3, length)
+        return self.redaction_marker
     
     def redact(self, text: str) -> str:
         """Apply redaction to text based on current revealed ranks.
         
+        All hidden terms are matched in a single pass over the text, with
+        an Aho-Corasick automaton for large term sets (see TermMatcher).
+        
         Args:
             text: The text to redact.
             
         Returns:
             Text with hidden terms replaced by redaction markers.
         """
-        patterns = self._build_patterns()
+        return _replace_spans(text, self._spans(text), self._replacement())
+    
+    def redact_many(self, texts: Iterable[str]) -> list[str]:
+        """Redact a batch of texts with the current revealed ranks.
         
-        result = text
-        for pattern, marker in patterns:
-            result = pattern.sub(marker, result)
+        Args:
+            texts: The texts to redact.
+            
+        Returns:
+            The redacted texts, in order.
+        """
+        matcher = self._build_matcher()
+        if matcher is None:
+            return list(texts)
         
-        return result
+        repl = self._replacement()
+        return [_replace_spans(text, matcher.spans(text), repl) for text in texts]
     
-    def count_redactions(self, text: str) -> int:
-        """Count how many redactions would be applied to text."""
-        patterns = self._build_patterns()
+    def redact_suffix(self, new_text: str) -> str:
+        """Redact only newly appended text.
+        
+        Equivalent to redacting the fragment on its own. Callers that keep
+        a previously redacted prefix can append the result instead of
+        re-redacting the whole text, as long as no hidden term spans the
+        join point and the revealed ranks are unchanged.
+        
+        Args:
+            new_text: The appended text fragment.
+            
+        Returns:
+            The fragment with hidden terms replaced by redaction markers.
+        """
+        return self.redact(new_text)
+    
+    def redact_append(self, prev_output: str, new_fragment: str, sep: str = "") -> str:
+        """Extend previously redacted output with a newly appended fragment.
         
-        count = 0
-        for pattern, _ in patterns:
-            count += len(pattern.findall(text))
+        Args:
+            prev_output: Output of an earlier redaction with the same revealed ranks.
+            new_fragment: The text appended since then (not yet redacted).
+            sep: Separator placed between the previous output and the fragment.
+            
+        Returns:
+            The combined redacted text.
+        """
+        return prev_output + sep + self.redact_suffix(new_fragment)
+    
+    def count_redactions(self, text: str) -> int:
+        """Count how many redactions would be applied to text.
         
-        return count
+        This is the number of markers redact() inserts: overlapping terms
+        (e.g. "cat" inside "domestic cat") are counted once.
+        """
+        return len(self._spans(text))
     
     def get_redaction_preview(self, text: str, max_length: int = 200) -> str:
         """Get a preview of the redacted text."""
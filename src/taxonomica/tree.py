@@ -7,7 +7,9 @@ enabling navigation through the tree of life.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -104,6 +106,15 @@ TAXOBOX_RANK_MAP = {
     "family": "family",
 }
 
+# Patterns used when parsing taxoboxes and cleaning wiki markup
+_TAXOBOX_SPLIT_RE = re.compile(r",\s*(?=\w+=)")
+_REF_RE = re.compile(r"<ref[^>]*>.*?</ref>", re.DOTALL)
+_SELF_CLOSING_REF_RE = re.compile(r"<ref[^>]*/>")
+_TAG_RE = re.compile(r"<[^>]+>")
+_WIKILINK_RE = re.compile(r"\[\[([^|\]]+\|)?([^\]]+)\]\]")
+_QUOTES_RE = re.compile(r"'{2,}")
+_BRACKETS_RE = re.compile(r"[\[\]]")
+
 
 def parse_taxobox(taxobox: str) -> dict[str, str]:
     """Parse a taxobox string into a dictionary of field=value pairs.
@@ -122,7 +133,7 @@ def parse_taxobox(taxobox: str) -> dict[str, str]:
         taxobox = taxobox[1:-1]
 
     result = {}
-    parts = re.split(r",\s*(?=\w+=)", taxobox)
+    parts = _TAXOBOX_SPLIT_RE.split(taxobox)
 
     for part in parts:
         if "=" in part:
@@ -152,27 +163,35 @@ def clean_wiki_markup(text: str) -> str:
     if not text:
         return ""
 
-    # Remove ref tags and their contents
-    text = re.sub(r"<ref[^>]*>.*?</ref>", "", text, flags=re.DOTALL)
-    text = re.sub(r"<ref[^>]*/>", "", text)
+    # Each pass is skipped when the text lacks the character it looks for;
+    # most values have at most one kind of markup
+
+    if "<" in text:
+        # Remove ref tags and their contents
+        text = _REF_RE.sub("", text)
+        text = _SELF_CLOSING_REF_RE.sub("", text)
 
-    # Remove other HTML tags
-    text = re.sub(r"<[^>]+>", "", text)
+        # Remove other HTML tags
+        text = _TAG_RE.sub("", text)
 
-    # Remove wiki links: [[Page|Display]] -> Display, [[Link]] -> Link
-    text = re.sub(r"\[\[([^|\]]+\|)?([^\]]+)\]\]", r"\2", text)
+    if "[" in text or "]" in text:
+        # Remove wiki links: [[Page|Display]] -> Display, [[Link]] -> Link
+        text = _WIKILINK_RE.sub(r"\2", text)
 
-    # Remove italic/bold markers
-    text = re.sub(r"'{2,}", "", text)
+    if "''" in text:
+        # Remove italic/bold markers
+        text = _QUOTES_RE.sub("", text)
 
-    # Remove any remaining brackets
-    text = re.sub(r"[\[\]]", "", text)
+    if "[" in text or "]" in text:
+        # Remove any remaining brackets
+        text = _BRACKETS_RE.sub("", text)
 
-    # Clean up HTML entities
-    text = text.replace("&nbsp;", " ")
-    text = text.replace("&amp;", "&")
-    text = text.replace("&lt;", "<")
-    text = text.replace("&gt;", ">")
+    if "&" in text:
+        # Clean up HTML entities
+        text = text.replace("&nbsp;", " ")
+        text = text.replace("&amp;", "&")
+        text = text.replace("&lt;", "<")
+        text = text.replace("&gt;", ">")
 
     # Clean up extra whitespace
     text = " ".join(text.split())
@@ -198,12 +217,24 @@ def extract_hierarchy_from_taxobox(taxobox: str) -> dict[str, str]:
             rank = TAXOBOX_RANK_MAP[key_lower]
             cleaned = clean_wiki_markup(value)
             if cleaned:
-                hierarchy[rank] = cleaned
+                # Higher-rank names repeat across most taxa; share one copy
+                hierarchy[rank] = sys.intern(cleaned)
 
     return hierarchy
 
 
-@dataclass
+@lru_cache(maxsize=64)
+def _required_major_ranks(rank: str) -> tuple[str, ...]:
+    """Get the major ranks a node of the given rank needs above it.
+
+    These are the major ranks higher in the hierarchy than the rank (all
+    of them for unknown ranks).
+    """
+    my_priority = RANK_PRIORITY.get(rank, 999)
+    return tuple(r for r in MAJOR_RANKS if RANK_PRIORITY[r] < my_priority)
+
+
+@dataclass(slots=True)
 class TaxonomyNode:
     """A node in the taxonomy tree.
 
@@ -251,9 +282,17 @@ class TaxonomyNode:
 
     def iter_descendants(self) -> Iterator[TaxonomyNode]:
         """Iterate over all descendants in depth-first order."""
-        for child in self.children.values():
-            yield child
-            yield from child.iter_descendants()
+        # One iterator per open level, so each step costs the same
+        # regardless of depth (no nested generators)
+        stack = [iter(self.children.values())]
+        while stack:
+            for child in stack[-1]:
+                yield child
+                if child.children:
+                    stack.append(iter(child.children.values()))
+                    break
+            else:
+                stack.pop()
 
     def get_rank_priority(self) -> int:
         """Get the rank priority (lower = higher in taxonomy hierarchy)."""
@@ -272,29 +311,11 @@ class TaxonomyNode:
         if self.rank == "root":
             return True
 
-        # Get ranks present in the path (excluding root)
-        path_ranks = set()
-        for node in self.get_path_to_root():
-            if node.rank and node.rank != "root":
-                path_ranks.add(node.rank)
-
-        # Determine which major ranks should be present based on this node's rank
-        if self.rank not in MAJOR_RANKS:
-            # For non-major ranks (like subfamily, tribe), check up to the next major rank
-            # Find the closest major rank above this one
-            my_priority = RANK_PRIORITY.get(self.rank, 999)
-            required_major_ranks = [r for r in MAJOR_RANKS if RANK_PRIORITY.get(r, 999) < my_priority]
-        else:
-            # For major ranks, all ranks above should be present
-            my_idx = MAJOR_RANKS.index(self.rank)
-            required_major_ranks = MAJOR_RANKS[:my_idx]
-
-        # Check if all required major ranks are present
-        for required_rank in required_major_ranks:
-            if required_rank not in path_ranks:
-                return False
-
-        return True
+        # Ranks present in the path (only major ranks are looked up)
+        path_ranks = {node.rank for node in self.get_path_to_root()}
+
+        # Check if all major ranks above this node's rank are present
+        return path_ranks.issuperset(_required_major_ranks(self.rank))
 
     def get_path_completeness(self) -> tuple[int, int]:
         """Get the completeness of the taxonomic path.
@@ -305,20 +326,22 @@ class TaxonomyNode:
         if self.rank == "root":
             return (0, 0)
 
-        path_ranks = set()
-        for node in self.get_path_to_root():
-            if node.rank and node.rank != "root":
-                path_ranks.add(node.rank)
+        path_ranks = {node.rank for node in self.get_path_to_root()}
 
-        my_priority = RANK_PRIORITY.get(self.rank, 999)
-        required_major_ranks = [r for r in MAJOR_RANKS if RANK_PRIORITY.get(r, 999) < my_priority]
+        required_major_ranks = _required_major_ranks(self.rank)
         present = sum(1 for r in required_major_ranks if r in path_ranks)
 
         return (present, len(required_major_ranks))
 
     def count_descendants(self) -> int:
         """Count all descendants of this node."""
-        return sum(1 for _ in self.iter_descendants())
+        total = 0
+        stack = [self]
+        while stack:
+            children = stack.pop().children
+            total += len(children)
+            stack.extend(children.values())
+        return total
 
     def get_species_descendants(self) -> Iterator[TaxonomyNode]:
         """Iterate over all species-level descendants."""
@@ -359,15 +382,14 @@ class TaxonomyTree:
 
     def _register_node(self, node: TaxonomyNode, taxon_id: str | None = None) -> None:
         """Register a node in the lookup indices."""
-        if node.name not in self._nodes_by_name:
-            self._nodes_by_name[node.name] = []
-        if node not in self._nodes_by_name[node.name]:
-            self._nodes_by_name[node.name].append(node)
+        same_name = self._nodes_by_name.get(node.name)
+        if same_name is None:
+            self._nodes_by_name[node.name] = [node]
+        elif node not in same_name:
+            same_name.append(node)
 
         # Also register by (name, rank) tuple for precise lookups
-        key = (node.name, node.rank)
-        if key not in self._nodes_by_name_rank:
-            self._nodes_by_name_rank[key] = node
+        self._nodes_by_name_rank.setdefault((node.name, node.rank), node)
 
         if taxon_id:
             node.taxon_ids.add(taxon_id)
@@ -431,8 +453,12 @@ class TaxonomyTree:
 
         # First pass: collect all taxa and their parent info
         print("  Pass 1: Collecting taxa and hierarchy info...")
-        taxa_info: list[tuple[str, str, str, dict[str, str], str]] = []
-        # (taxon_id, name, rank, hierarchy_dict, wikipedia_url)
+        # One column per field, so later passes zip only the fields they use
+        taxon_ids: list[str] = []
+        names: list[str] = []
+        ranks: list[str] = []
+        hierarchies: list[dict[str, str]] = []
+        urls: list[str] = []
 
         for i, taxon in enumerate(archive.iter_taxa(), 1):
             tree.stats["taxa_processed"] += 1
@@ -449,38 +475,36 @@ class TaxonomyTree:
 
             # Also check standard DwC fields as fallback/supplement
             if taxon.kingdom and "kingdom" not in hierarchy:
-                hierarchy["kingdom"] = taxon.kingdom
+                hierarchy["kingdom"] = sys.intern(taxon.kingdom)
             if taxon.phylum and "phylum" not in hierarchy:
-                hierarchy["phylum"] = taxon.phylum
+                hierarchy["phylum"] = sys.intern(taxon.phylum)
             if taxon.class_ and "class" not in hierarchy:
-                hierarchy["class"] = taxon.class_
+                hierarchy["class"] = sys.intern(taxon.class_)
             if taxon.order and "order" not in hierarchy:
-                hierarchy["order"] = taxon.order
+                hierarchy["order"] = sys.intern(taxon.order)
             if taxon.family and "family" not in hierarchy:
-                hierarchy["family"] = taxon.family
+                hierarchy["family"] = sys.intern(taxon.family)
             if taxon.genus and "genus" not in hierarchy:
-                hierarchy["genus"] = taxon.genus
+                hierarchy["genus"] = sys.intern(taxon.genus)
 
-            rank = (taxon.rank or "").lower()
-            if rank not in RANK_ORDER:
+            rank = sys.intern((taxon.rank or "").lower())
+            if rank not in RANK_PRIORITY:
                 rank = ""
 
-            taxa_info.append((
-                taxon.id,
-                taxon.scientific_name,
-                rank,
-                hierarchy,
-                taxon.references or "",
-            ))
+            taxon_ids.append(taxon.id)
+            names.append(taxon.scientific_name)
+            ranks.append(rank)
+            hierarchies.append(hierarchy)
+            urls.append(taxon.references or "")
 
             if progress_interval and i % progress_interval == 0:
                 print(f"    Collected {i:,} taxa...")
 
-        print(f"    Total collected: {len(taxa_info):,} taxa")
+        print(f"    Total collected: {len(taxon_ids):,} taxa")
 
         # Second pass: Create nodes for taxa that have their own Wikipedia page
         print("  Pass 2: Creating nodes...")
-        for taxon_id, name, rank, hierarchy, url in taxa_info:
+        for taxon_id, name, rank, url in zip(taxon_ids, names, ranks, urls):
             if not rank:
                 continue
 
@@ -504,38 +528,55 @@ class TaxonomyTree:
         print("  Pass 3: Linking nodes to parents...")
         linked = 0
 
-        for taxon_id, name, rank, hierarchy, _ in taxa_info:
+        for taxon_id, rank, hierarchy in zip(taxon_ids, ranks, hierarchies):
             if not rank:
                 continue
 
             node = tree.find_by_taxon_id(taxon_id)
-            if not node or node.parent != tree.root:
+            if not node or node.parent is not tree.root:
                 continue  # Already linked or not found
 
             # Find the best parent from hierarchy
             parent_node = tree._find_best_parent(node, hierarchy)
-            if parent_node and parent_node != tree.root:
+            if parent_node and parent_node is not tree.root:
                 # Re-parent the node
-                if node.name in tree.root.children:
-                    del tree.root.children[node.name]
+                tree.root.children.pop(node.name, None)
                 parent_node.add_child(node)
                 linked += 1
 
         tree.stats["nodes_linked"] = linked
         print(f"    Linked {linked:,} nodes to parents")
 
-        # Fourth pass: Create implicit parent nodes from hierarchy
+        # Fourth pass: Create implicit parent nodes from hierarchy. The same
+        # scan collects, for Pass 6, the hierarchy above genus level that
+        # species give for their genus.
         print("  Pass 4: Creating implicit parent nodes from hierarchy...")
         implicit_created = 0
+        genus_hierarchy: dict[str, dict[str, str]] = {}
 
-        for taxon_id, name, rank, hierarchy, _ in taxa_info:
+        for name, rank, hierarchy in zip(names, ranks, hierarchies):
             if not hierarchy:
                 continue
 
+            if rank == "species":
+                # Get genus name from hierarchy or species name
+                genus_name = hierarchy.get("genus")
+                if not genus_name and name:
+                    parts = name.split()
+                    if len(parts) >= 2:
+                        genus_name = parts[0]
+
+                if genus_name:
+                    if genus_name not in genus_hierarchy:
+                        genus_hierarchy[genus_name] = {}
+                    for h_rank, h_name in hierarchy.items():
+                        if h_rank != "genus" and h_rank != "species" and h_rank != "subspecies":
+                            genus_hierarchy[genus_name][h_rank] = h_name
+
             # Sort hierarchy by rank order
             sorted_items = sorted(
-                [(r, n) for r, n in hierarchy.items() if r in RANK_ORDER],
-                key=lambda x: RANK_ORDER.index(x[0]),
+                [(r, n) for r, n in hierarchy.items() if r in RANK_PRIORITY],
+                key=lambda x: RANK_PRIORITY[x[0]],
             )
 
             # Walk through hierarchy creating/linking nodes
@@ -551,10 +592,9 @@ class TaxonomyTree:
                         tree.root.add_child(existing)
                     tree._register_node(existing)
                     implicit_created += 1
-                elif existing.parent == tree.root and prev_node:
+                elif existing.parent is tree.root and prev_node:
                     # Re-parent existing node
-                    if existing.name in tree.root.children:
-                        del tree.root.children[existing.name]
+                    tree.root.children.pop(existing.name, None)
                     prev_node.add_child(existing)
                     tree.stats["nodes_linked"] += 1
 
@@ -567,17 +607,18 @@ class TaxonomyTree:
         print("  Pass 5: Linking species to genera by name...")
         species_linked = 0
 
-        for node in list(tree.root.children.values()):
+        root_children = tree.root.children
+        nodes_by_name_rank = tree._nodes_by_name_rank
+        for node in list(root_children.values()):
             if node.rank != "species":
                 continue
 
             # Try to find genus from species name (binomial: "Genus species")
-            parts = node.name.split()
-            if len(parts) >= 2:
-                genus_name = parts[0]
-                genus_node = tree.find_by_name_and_rank(genus_name, "genus")
-                if genus_node and genus_node != node.parent:
-                    del tree.root.children[node.name]
+            parts = node.name.split(None, 1)
+            if len(parts) == 2:
+                genus_node = nodes_by_name_rank.get((parts[0], "genus"))
+                if genus_node and genus_node is not node.parent:
+                    del root_children[node.name]
                     genus_node.add_child(node)
                     species_linked += 1
 
@@ -587,30 +628,7 @@ class TaxonomyTree:
         # Sixth pass: Propagate hierarchy from species to orphaned genera
         print("  Pass 6: Propagating hierarchy from species to genera...")
 
-        # Collect hierarchy info from species for each genus
-        genus_hierarchy: dict[str, dict[str, str]] = {}
-        for taxon_id, name, rank, hierarchy, _ in taxa_info:
-            if rank != "species" or not hierarchy:
-                continue
-
-            # Get genus name from hierarchy or species name
-            genus_name = hierarchy.get("genus")
-            if not genus_name and name:
-                parts = name.split()
-                if len(parts) >= 2:
-                    genus_name = parts[0]
-
-            if not genus_name:
-                continue
-
-            # Collect hierarchy above genus level
-            if genus_name not in genus_hierarchy:
-                genus_hierarchy[genus_name] = {}
-            for h_rank, h_name in hierarchy.items():
-                if h_rank != "genus" and h_rank != "species" and h_rank != "subspecies":
-                    genus_hierarchy[genus_name][h_rank] = h_name
-
-        # Now link orphaned genera using collected hierarchy
+        # Link orphaned genera using the hierarchy collected in Pass 4
         genera_linked = 0
         for node in list(tree.root.children.values()):
             if node.rank != "genus":
@@ -621,7 +639,7 @@ class TaxonomyTree:
 
             hierarchy = genus_hierarchy[node.name]
             parent_node = tree._find_best_parent(node, hierarchy)
-            if parent_node and parent_node != tree.root:
+            if parent_node and parent_node is not tree.root:
                 del tree.root.children[node.name]
                 parent_node.add_child(node)
                 genera_linked += 1
@@ -645,16 +663,15 @@ class TaxonomyTree:
         if not hierarchy:
             return None
 
-        node_rank_idx = RANK_ORDER.index(node.rank) if node.rank in RANK_ORDER else -1
+        node_rank_idx = RANK_PRIORITY.get(node.rank, -1)
         if node_rank_idx <= 0:
             return None
 
         # Look for parent ranks in order from closest to furthest
-        for i in range(node_rank_idx - 1, -1, -1):
-            parent_rank = RANK_ORDER[i]
-            if parent_rank in hierarchy:
-                parent_name = hierarchy[parent_rank]
-                parent_node = self.find_by_name_and_rank(parent_name, parent_rank)
+        for parent_rank in reversed(RANK_ORDER[:node_rank_idx]):
+            parent_name = hierarchy.get(parent_rank)
+            if parent_name is not None:
+                parent_node = self._nodes_by_name_rank.get((parent_name, parent_rank))
                 if parent_node:
                     return parent_node
 
@@ -173,35 +173,37 @@ class NodeListDisplay:
         self.page = 0
 
 
-def display_node_list(
+def format_node_list(
     children: list[TaxonomyNode],
     config: NodeListDisplay,
     header: str = "Children:",
-) -> None:
-    """Display a paginated list of nodes.
+) -> list[str]:
+    """Format a paginated list of nodes as output lines.
     
     Args:
         children: The full list of children (already sorted/filtered).
         config: Display configuration.
         header: Header text to show above the list.
+        
+    Returns:
+        Lines to print, without trailing newlines.
     """
     total_children = len(children)
     total_pages = config.get_total_pages(total_children)
     
     if total_children == 0:
-        print()
-        print("  (No options available)")
-        print()
-        return
+        return ["", "  (No options available)", ""]
     
+    lines = []
+    append = lines.append
     page_children = config.get_page_children(children)
     
     # Header with legend
     if config.show_complete_marker:
-        print(f"\n  {header:<60} (✓ = complete path)")
+        append(f"\n  {header:<60} (✓ = complete path)")
     else:
-        print(f"\n  {header}")
-    print()
+        append(f"\n  {header}")
+    append("")
     
     # Display each child
     for i, child in enumerate(page_children):
@@ -233,9 +235,9 @@ def display_node_list(
         else:
             child_info = ""
         
-        print(f"  {complete_marker} ({label}) {name_display:<30} {vn_display:<24} {rank_str:<12} {child_info:>12}")
+        append(f"  {complete_marker} ({label}) {name_display:<30} {vn_display:<24} {rank_str:<12} {child_info:>12}")
     
-    print()
+    append("")
     
     # Pagination
     if total_pages > 1:
@@ -245,7 +247,24 @@ def display_node_list(
         if config.page < total_pages - 1:
             nav_hints.append("[N]ext")
         nav_str = "  ".join(nav_hints)
-        print(f"  Page {config.page + 1}/{total_pages}   {nav_str}")
+        append(f"  Page {config.page + 1}/{total_pages}   {nav_str}")
+    
+    return lines
+
+
+def display_node_list(
+    children: list[TaxonomyNode],
+    config: NodeListDisplay,
+    header: str = "Children:",
+) -> None:
+    """Display a paginated list of nodes.
+    
+    Args:
+        children: The full list of children (already sorted/filtered).
+        config: Display configuration.
+        header: Header text to show above the list.
+    """
+    print("\n".join(format_node_list(children, config, header)))
 
 
 def display_command_bar(
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
 csv.field_size_limit(sys.maxsize)
 
 
-@dataclass
+@dataclass(slots=True)
 class WikipediaDescription:
     """A description section from a Wikipedia species page."""
     
@@ -39,7 +39,7 @@ class WikipediaDescription:
         return text
 
 
-@dataclass
+@dataclass(slots=True)
 class WikipediaSpecies:
     """A species entry from the Wikipedia DwC-A export."""
     
@@ -51,6 +51,18 @@ class WikipediaSpecies:
     descriptions: list[WikipediaDescription] = field(default_factory=list)
     vernacular_names: list[str] = field(default_factory=list)
     
+    @property
+    def raw_text_length(self) -> int:
+        """Length of all description text before cleaning.
+        
+        Counts the separators used by get_all_text(), so this is an upper
+        bound on the length of get_useful_text() and can be used as a cheap
+        pre-check before extracting text.
+        """
+        if not self.descriptions:
+            return 0
+        return sum(len(desc.text) for desc in self.descriptions) + 2 * (len(self.descriptions) - 1)
+    
     def get_abstract(self) -> str | None:
         """Get the abstract/summary description."""
         for desc in self.descriptions:
@@ -24,7 +24,7 @@ from taxonomica.gbif_backbone import GBIFBackbone
 from taxonomica.gbif_tree import GBIFTaxonomyTree, TaxonomyNode
 from taxonomica.wikipedia import WikipediaData
 from taxonomica.redaction import Redactor, build_redaction_terms_from_node
-from taxonomica.popularity import PopularityIndex
+from taxonomica.popularity import DIFFICULTY_THRESHOLDS, PopularityIndex
 
 app = Flask(__name__)
 app.secret_key = 'taxonomica-secret-key-change-in-production'
@@ -40,14 +40,6 @@ popularity_index: PopularityIndex | None = None
 # In production, use Redis or similar. This is fine for single-server development.
 game_descriptions: dict[str, list[str]] = {}
 
-# Difficulty thresholds
-DIFFICULTY_THRESHOLDS = {
-    "easy": 55,
-    "medium": 49,
-    "hard": 24,
-    "expert": 0,
-}
-
 # Game ranks
 ALL_RANKS = ["kingdom", "phylum", "class", "order", "family", "genus", "species"]
 
@@ -160,21 +152,17 @@ def find_species_with_wikipedia(
     min_score = DIFFICULTY_THRESHOLDS.get(difficulty, 0)
     
     # Pre-filter by difficulty
-    candidate_names: set[str] | None = None
+    candidate_names: frozenset[str] | None = None
     if difficulty != "expert" and popularity_index and min_score > 0:
-        candidate_names = set()
-        for metrics in popularity_index._by_id.values():
-            if metrics.popularity_score >= min_score and metrics.section_count >= 2:
-                candidate_names.add(metrics.scientific_name.lower())
+        candidate_names = popularity_index.candidates_for(difficulty)
     
     # Get species nodes
     species_nodes = []
-    for node in tree._nodes_by_id.values():
-        if node.rank == "species" and node.has_complete_path():
-            if candidate_names is not None:
-                if node.name.lower() not in candidate_names:
-                    continue
-            species_nodes.append(node)
+    for node in tree.get_complete_path_nodes("species"):
+        if candidate_names is not None:
+            if node.name.lower() not in candidate_names:
+                continue
+        species_nodes.append(node)
     
     if not species_nodes:
         return None